@@ -0,0 +1,216 @@
+"""
+Benchmarks of the conductor thermal model.
+
+    python -m benchmarks.conductor --sizes 1 1000 1000000 --save baseline.json
+    python -m benchmarks.conductor --compare baseline.json
+
+Every benchmark reports its run time, throughput (ratings/sec) and peak traced memory.
+With ``--compare`` the run fails when a benchmark got slower than the saved baseline
+by more than ``--tolerance``.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+import numpy as np
+
+from pyohm.models.conductor import Conductor
+from pyohm.models.conductor_batch import ConductorBatch
+
+# Heat terms timed on their own
+HeatTerms: tuple[str, ...] = (
+    "t_film",
+    "air_density",
+    "forced_convection_heat_loss",
+    "radiated_heat_loss",
+    "solar_heat_gain",
+    "conductor_current",
+)
+
+# Scalar benchmarks loop in Python, larger sizes are skipped
+MaxScalarSize: int = 100_000
+
+# setup(size) -> run(), the run is timed
+Setup = Callable[[int], Callable[[], object]]
+
+
+def _conductors(size: int) -> list[Conductor]:
+    rng = np.random.default_rng(0)
+    conductors = []
+    for wind_speed, ambient_temperature, hour in zip(
+        rng.uniform(0.5, 10.0, size).tolist(), rng.uniform(-10.0, 40.0, size).tolist(), rng.integers(0, 24, size)
+    ):
+        conductor = Conductor()
+        conductor.use_default()
+        conductor.wind_speed = wind_speed
+        conductor.ambient_temperature = ambient_temperature
+        conductor.date = datetime(2023, 6, 10) + timedelta(hours=int(hour))
+        conductors.append(conductor)
+    return conductors
+
+
+def _batch(size: int) -> ConductorBatch:
+    rng = np.random.default_rng(0)
+    return ConductorBatch(
+        wind_speed=rng.uniform(0.5, 10.0, size),
+        ambient_temperature=rng.uniform(-10.0, 40.0, size),
+        date=np.datetime64("2023-06-10T00:00:00") + rng.integers(0, 24, size) * np.timedelta64(1, "h"),
+    )
+
+
+def construction(size: int) -> Callable[[], object]:
+    def run() -> object:
+        conductors = []
+        for _ in range(size):
+            conductor = Conductor()
+            conductor.use_default()
+            conductors.append(conductor)
+        return conductors
+
+    return run
+
+
+def scalar_term(term: str) -> Setup:
+    def setup(size: int) -> Callable[[], object]:
+        conductors = _conductors(size)
+
+        def run() -> object:
+            for conductor in conductors:
+                conductor.invalidate()
+                getattr(conductor, term)
+            return None
+
+        return run
+
+    return setup
+
+
+def batch_term(term: str) -> Setup:
+    def setup(size: int) -> Callable[[], object]:
+        batch = _batch(size)
+
+        def run() -> object:
+            batch.invalidate()
+            return getattr(batch, term)
+
+        return run
+
+    return setup
+
+
+def batch_construction(size: int) -> Callable[[], object]:
+    rng = np.random.default_rng(0)
+    wind_speed = rng.uniform(0.5, 10.0, size)
+
+    def run() -> object:
+        return ConductorBatch(wind_speed=wind_speed)
+
+    return run
+
+
+# name -> (setup, scalar)
+Benchmarks: dict[str, tuple[Setup, bool]] = {
+    "scalar/construction": (construction, True),
+    **{f"scalar/{term}": (scalar_term(term), True) for term in HeatTerms},
+    "batch/construction": (batch_construction, False),
+    **{f"batch/{term}": (batch_term(term), False) for term in HeatTerms},
+}
+
+
+def measure(setup: Setup, size: int, repeat: int = 3) -> dict[str, float]:
+    """
+    Best run time of ``repeat`` runs and the peak memory traced during one more run
+    """
+    run = setup(size)
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "size": size,
+        "seconds": seconds,
+        "ratings_per_second": size / seconds if seconds > 0 else float("inf"),
+        "peak_memory": peak_memory,
+    }
+
+
+def run_suite(sizes: list[int], names: Optional[list[str]] = None, repeat: int = 3) -> dict[str, dict[str, float]]:
+    """
+    Run every benchmark (or only ``names``) for every size, keyed by "name[size]"
+    """
+    results = {}
+    for name, (setup, scalar) in Benchmarks.items():
+        if names and name not in names:
+            continue
+        for size in sizes:
+            if scalar and size > MaxScalarSize:
+                continue
+            results[f"{name}[{size}]"] = measure(setup, size, repeat)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float = 0.2
+) -> list[str]:
+    """
+    Benchmarks which are more than ``tolerance`` slower than in ``baseline``
+    """
+    regressions = []
+    for key, result in results.items():
+        if key in baseline and result["seconds"] > baseline[key]["seconds"] * (1 + tolerance):
+            regressions.append(
+                f"{key}: {result['seconds']:.6f}s, baseline {baseline[key]['seconds']:.6f}s "
+                f"(+{result['seconds'] / baseline[key]['seconds'] - 1:.0%})"
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000, 1_000_000])
+    parser.add_argument("--only", nargs="+", help="benchmark names to run", choices=list(Benchmarks))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="write the results as JSON baseline")
+    parser.add_argument("--compare", help="JSON baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.only, args.repeat)
+
+    print(f"{'benchmark':<45} {'seconds':>12} {'ratings/sec':>14} {'peak memory':>14}")
+    for key, result in results.items():
+        print(
+            f"{key:<45} {result['seconds']:>12.6f} {result['ratings_per_second']:>14.0f} "
+            f"{result['peak_memory'] / 2**20:>11.2f} MiB"
+        )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
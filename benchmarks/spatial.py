@@ -0,0 +1,86 @@
+"""
+Benchmarks of the asset spatial index.
+
+    python -m benchmarks.spatial --sizes 10000 1000000
+
+Reports the time to build the index and the mean time per query of box, radius and
+nearest neighbour queries, next to a linear scan of all points. Radius and nearest neighbour
+queries are timed as one batch of all query points.
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from pyohm.network.spatial import SpatialIndex
+
+
+def _points(size: int) -> np.ndarray:
+    """
+    Asset-like coordinates, half spread over a 100 x 100 area and half clustered in towns
+    """
+    rng = np.random.default_rng(0)
+    towns = rng.uniform(0.0, 100.0, (max(size // 10_000, 1), 2))
+    clustered = towns[rng.integers(0, len(towns), size - size // 2)] + rng.normal(0.0, 0.5, (size - size // 2, 2))
+    return np.concatenate([rng.uniform(0.0, 100.0, (size // 2, 2)), clustered])
+
+
+def _per_query(run: Callable[[np.ndarray], object], queries: np.ndarray) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        run(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def _batched(run: Callable[[np.ndarray], object], queries: np.ndarray) -> float:
+    start = time.perf_counter()
+    run(queries)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def run_suite(sizes: list[int], queries: int = 1000) -> dict[str, dict[str, float]]:
+    """
+    Seconds to build the index and seconds per query of every query type, keyed by size
+    """
+    results = {}
+    for size in sizes:
+        points = _points(size)
+        query_points = _points(queries)
+
+        start = time.perf_counter()
+        index = SpatialIndex(points)
+        build = time.perf_counter() - start
+
+        results[str(size)] = {
+            "build": build,
+            "box": _per_query(lambda query: index.query_box(query - 0.5, query + 0.5), query_points),
+            "radius": _batched(lambda query: index.query_radius(query, 0.5), query_points),
+            "nearest": _batched(lambda query: index.query_nearest(query, 1), query_points),
+            "nearest_10": _batched(lambda query: index.query_nearest(query, 10), query_points),
+            "linear_scan": _per_query(
+                lambda query: np.argmin(np.sum((points - query) ** 2, axis=1)), query_points[: max(queries // 100, 1)]
+            ),
+        }
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.queries)
+
+    queries = ("box", "radius", "nearest", "nearest_10", "linear_scan")
+    print(f"{'points':>10} {'build (s)':>10} " + " ".join(f"{query + ' (us)':>16}" for query in queries))
+    for size, result in results.items():
+        print(f"{size:>10} {result['build']:>10.3f} " + " ".join(f"{result[query] * 1e6:>16.1f}" for query in queries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
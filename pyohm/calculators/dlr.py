@@ -0,0 +1,96 @@
+import csv
+import itertools
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Union
+
+import numpy as np
+
+from pyohm.models.conductor_batch import ConductorBatch, ConductorInputs
+
+# A chunk of weather rows (or ratings), column name -> 1-D array
+Chunk = dict[str, np.ndarray]
+
+PathLike = Union[str, Path]
+
+
+def _column(name: str, values: list[str]) -> np.ndarray:
+    if name == "date":
+        return np.array(values, dtype="datetime64[s]")
+    if name == "clear_atmosphere":
+        return np.array([value.strip().lower() in ("1", "true", "yes") for value in values])
+    if name in ConductorInputs:
+        return np.array(values, dtype=np.float64)
+    return np.array(values)
+
+
+def read_weather_csv(path: PathLike, chunk_size: int = 100_000) -> Iterator[Chunk]:
+    """
+    Read a CSV file with a header row in chunks of ``chunk_size`` rows.
+
+    Columns named after ``ConductorBatch`` inputs are parsed (``date`` as ISO 8601 timestamps),
+    any other column, e.g. a span id, is passed through as strings.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        while rows := list(itertools.islice(reader, chunk_size)):
+            yield {name: _column(name, list(values)) for name, values in zip(header, zip(*rows))}
+
+
+def read_weather_npy(path: PathLike, chunk_size: int = 100_000) -> Iterator[Chunk]:
+    """
+    Read a structured ``.npy`` array (one field per column) in chunks of ``chunk_size`` rows.
+
+    The file is memory-mapped, only the current chunk is copied into memory.
+    """
+    table = np.load(path, mmap_mode="r")
+    if table.dtype.names is None:
+        raise ValueError(f"{path} does not hold a structured array")
+    for start in range(0, len(table), chunk_size):
+        rows = table[start : start + chunk_size]
+        yield {name: np.array(rows[name]) for name in table.dtype.names}
+
+
+def read_weather(path: PathLike, chunk_size: int = 100_000) -> Iterator[Chunk]:
+    """
+    ``read_weather_npy`` for ``.npy`` files, ``read_weather_csv`` otherwise
+    """
+    if Path(path).suffix == ".npy":
+        return read_weather_npy(path, chunk_size)
+    return read_weather_csv(path, chunk_size)
+
+
+def rate_chunks(chunks: Iterable[Chunk], **inputs: Any) -> Iterator[Chunk]:
+    """
+    Rate every weather chunk with ``ConductorBatch`` and yield it with a ``conductor_current`` column.
+
+    ``inputs`` are fixed ``ConductorBatch`` inputs (e.g. the conductor spec), chunk columns
+    which are conductor inputs override them row by row.
+    """
+    for chunk in chunks:
+        batch = ConductorBatch(**{**inputs, **{key: value for key, value in chunk.items() if key in ConductorInputs}})
+        current = np.broadcast_to(batch.conductor_current, (len(next(iter(chunk.values()))),))
+        yield {**chunk, "conductor_current": current}
+
+
+def write_ratings_csv(chunks: Iterable[Chunk], path: PathLike) -> int:
+    """
+    Write rated chunks to a CSV file, returns the number of rows written.
+    """
+    rows = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        for chunk in chunks:
+            if rows == 0:
+                writer.writerow(chunk)
+            writer.writerows(zip(*(column.tolist() for column in chunk.values())))
+            rows += len(next(iter(chunk.values())))
+    return rows
+
+
+def rate_weather_file(source: PathLike, destination: PathLike, chunk_size: int = 100_000, **inputs: Any) -> int:
+    """
+    Stream weather rows from ``source`` through the rating into a CSV at ``destination``,
+    memory use is bounded by ``chunk_size`` regardless of the series length.
+    """
+    return write_ratings_csv(rate_chunks(read_weather(source, chunk_size), **inputs), destination)
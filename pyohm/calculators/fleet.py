@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Mapping, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.models.conductor_batch import ConductorBatch, ConductorInputs
+
+# Shared array description passed to the workers, (shared memory name, shape, dtype)
+ArrayDescriptor = tuple[str, tuple[int, ...], str]
+
+# Arrays attached by a worker process, input name -> array, "conductor_current" is the output
+_worker_arrays: dict[str, np.ndarray] = {}
+_worker_memory: list[SharedMemory] = []
+
+
+def _as_input(key: str, value: npt.ArrayLike) -> np.ndarray:
+    if key == "date":
+        return np.asarray(value, dtype="datetime64[s]")
+    if key == "clear_atmosphere":
+        return np.asarray(value, dtype=bool)
+    return np.asarray(value, dtype=np.float64)
+
+
+def _attach(descriptors: dict[str, ArrayDescriptor]) -> None:
+    for key, (name, shape, dtype) in descriptors.items():
+        memory = SharedMemory(name=name)
+        _worker_memory.append(memory)
+        _worker_arrays[key] = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+
+def _rate_rows(rows: tuple[int, int]) -> None:
+    start, stop = rows
+    output = _worker_arrays["conductor_current"]
+    inputs = {
+        key: value[start:stop] if value.shape[0] > 1 else value
+        for key, value in _worker_arrays.items()
+        if key != "conductor_current"
+    }
+    output[start:stop] = ConductorBatch(**inputs).conductor_current
+
+
+def rate_fleet(
+    inputs: Mapping[str, npt.ArrayLike],
+    processes: Optional[int] = None,
+    chunks_per_process: int = 4,
+    **fixed_inputs: Any,
+) -> np.ndarray:
+    """
+    ``ConductorBatch.conductor_current`` of a whole fleet computed by a process pool.
+
+    ``inputs`` are ``ConductorBatch`` input arrays which broadcast to the fleet shape, e.g.
+    (spans, hours). They are copied once into shared memory and the work is split along the
+    first axis, so neither inputs nor results are pickled. ``fixed_inputs`` are scalars
+    passed to every worker batch unchanged. ``processes`` defaults to the number of CPUs,
+    with a single process everything runs in the calling process.
+    """
+    unknown = (set(inputs) | set(fixed_inputs)) - set(ConductorInputs)
+    if unknown:
+        raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+
+    arrays = {key: _as_input(key, value) for key, value in inputs.items()}
+    arrays.update({key: _as_input(key, value) for key, value in fixed_inputs.items()})
+    shape = np.broadcast_shapes(*(value.shape for value in arrays.values()), (1,))
+    arrays = {key: value.reshape((1,) * (len(shape) - value.ndim) + value.shape) for key, value in arrays.items()}
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        return np.broadcast_to(ConductorBatch(**arrays).conductor_current, shape).copy()
+
+    memory: list[SharedMemory] = []
+    descriptors: dict[str, ArrayDescriptor] = {}
+    try:
+        for key, value in [*arrays.items(), ("conductor_current", np.empty(shape))]:
+            block = SharedMemory(create=True, size=max(value.nbytes, 1))
+            memory.append(block)
+            np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+            descriptors[key] = (block.name, value.shape, value.dtype.str)
+
+        bounds = np.linspace(0, shape[0], min(processes * chunks_per_process, shape[0]) + 1).astype(int)
+        with multiprocessing.Pool(processes, initializer=_attach, initargs=(descriptors,)) as pool:
+            pool.map(_rate_rows, list(zip(bounds[:-1].tolist(), bounds[1:].tolist())))
+
+        _, _, dtype = descriptors["conductor_current"]
+        return np.ndarray(shape, dtype=dtype, buffer=memory[-1].buf).copy()
+    finally:
+        for block in memory:
+            block.close()
+            block.unlink()
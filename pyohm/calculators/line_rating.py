@@ -0,0 +1,67 @@
+from typing import Any, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.models.conductor_batch import ConductorBatch, ConductorInputs
+
+
+class LineRatingResult(NamedTuple):
+    # Line rating (A) at each timestep, shape (timesteps,)
+    rating: np.ndarray
+
+    # Index of the span limiting the line at each timestep, shape (timesteps,)
+    limiting_span: np.ndarray
+
+    # Rating of every span (A), shape (timesteps, spans)
+    span_ratings: np.ndarray
+
+
+class LineRating:
+    """
+    Rating of a line made of spans, the minimum of its span ratings at each timestep.
+
+    ``span_inputs`` are per-span ``ConductorBatch`` inputs of shape (spans,), typically
+    ``azimuth_of_conductor``, ``latitude`` and ``elevation``, or scalars shared by all spans.
+    """
+
+    def __init__(self, **span_inputs: npt.ArrayLike) -> None:
+        unknown = set(span_inputs) - set(ConductorInputs)
+        if unknown:
+            raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+
+        self.span_inputs = {key: np.asarray(value) for key, value in span_inputs.items()}
+        self.spans = int(np.broadcast_shapes(*(value.shape for value in self.span_inputs.values()), (1,))[0])
+
+    def rate(self, date: npt.ArrayLike, chunk_size: int = 1024, **weather: Any) -> LineRatingResult:
+        """
+        Rate the line at every timestamp of ``date``.
+
+        ``weather`` values are ``ConductorBatch`` inputs which are either shared by all spans,
+        shape (timesteps,) or scalar, or given per span, shape (timesteps, spans). Timesteps are
+        evaluated ``chunk_size`` at a time to bound memory on lines with many spans.
+        """
+        unknown = set(weather) - set(ConductorInputs)
+        if unknown:
+            raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+
+        date = np.atleast_1d(np.asarray(date, dtype="datetime64[s]"))
+        timesteps = len(date)
+        weather_arrays = {}
+        for key, value in weather.items():
+            value = np.asarray(value)
+            weather_arrays[key] = value[:, None] if value.ndim == 1 else value
+
+        span_ratings = np.empty((timesteps, self.spans))
+        for start in range(0, timesteps, chunk_size):
+            stop = min(start + chunk_size, timesteps)
+            inputs = {
+                key: value[start:stop] if value.ndim and value.shape[0] == timesteps else value
+                for key, value in weather_arrays.items()
+            }
+            batch = ConductorBatch(**self.span_inputs, **inputs, date=date[start:stop, None])
+            span_ratings[start:stop] = batch.conductor_current
+
+        limiting_span = np.argmin(np.where(np.isnan(span_ratings), np.inf, span_ratings), axis=1)
+        rating = np.take_along_axis(span_ratings, limiting_span[:, None], axis=1)[:, 0]
+        return LineRatingResult(rating, limiting_span, span_ratings)
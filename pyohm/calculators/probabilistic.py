@@ -0,0 +1,164 @@
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.models.conductor_batch import ConductorBatch, ConductorInputs
+
+# sampler(rng, shape) -> samples of a ConductorBatch input, shape (spans, samples)
+Sampler = Callable[[np.random.Generator, tuple[int, int]], np.ndarray]
+
+
+def _per_span(value: npt.ArrayLike) -> np.ndarray:
+    value = np.asarray(value, dtype=np.float64)
+    return value[:, None] if value.ndim == 1 else value
+
+
+def normal(mean: npt.ArrayLike, std: npt.ArrayLike) -> Sampler:
+    """
+    Normal distribution, parameters are scalars or per-span arrays
+    """
+    mean, std = _per_span(mean), _per_span(std)
+    return lambda rng, shape: rng.normal(mean, std, shape)
+
+
+def uniform(low: npt.ArrayLike, high: npt.ArrayLike) -> Sampler:
+    """
+    Uniform distribution, parameters are scalars or per-span arrays
+    """
+    low, high = _per_span(low), _per_span(high)
+    return lambda rng, shape: rng.uniform(low, high, shape)
+
+
+def weibull(shape_parameter: npt.ArrayLike, scale: npt.ArrayLike) -> Sampler:
+    """
+    Weibull distribution, e.g. of wind speed, parameters are scalars or per-span arrays
+    """
+    shape_parameter, scale = _per_span(shape_parameter), _per_span(scale)
+    return lambda rng, shape: scale * rng.weibull(np.broadcast_to(shape_parameter, shape))
+
+
+def von_mises(mean_direction: npt.ArrayLike, kappa: npt.ArrayLike) -> Sampler:
+    """
+    Von Mises distribution of a direction in degrees within [0, 360), parameters are scalars or per-span arrays
+    """
+    mean, concentration = np.radians(_per_span(mean_direction)), _per_span(kappa)
+    return lambda rng, shape: np.degrees(rng.vonmises(mean, concentration, shape)) % 360
+
+
+class QuantileHistogram:
+    """
+    Streaming per-span quantiles from fixed-width histograms.
+
+    The range of every span is set from its first finite values, widened by ``margin`` times
+    their spread on both sides. When later values fall outside it the range grows to cover them
+    by merging neighbouring bins, the bin width doubling as often as needed, so counts are never
+    clipped and quantiles resolve to (range / bins) of the current range.
+    """
+
+    def __init__(self, spans: int, bins: int = 1024, margin: float = 0.5) -> None:
+        self.spans = spans
+        self.bins = bins
+        self.margin = margin
+        self.counts = np.zeros((spans, bins), dtype=np.int64)
+        # NaN until the span has seen a finite value
+        self.lower = np.full(spans, np.nan)
+        self.width = np.full(spans, np.nan)
+
+    def _initialize(self, spans: np.ndarray, values: np.ndarray) -> None:
+        low, high = np.fmin.reduce(values, axis=1), np.fmax.reduce(values, axis=1)
+        spread = np.maximum(high - low, np.maximum(np.abs(high), 1.0) * 1e-6)
+        self.lower[spans] = low - self.margin * spread
+        self.width[spans] = spread * (1 + 2 * self.margin) / self.bins
+
+    def _grow(self, spans: np.ndarray, low: np.ndarray, high: np.ndarray) -> None:
+        """
+        Widen the range of ``spans`` to cover [low, high], shifting the lower edge by whole bins
+        and merging bins by a power of two so every old bin falls inside one new bin
+        """
+        lower, width = self.lower[spans], self.width[spans]
+        shift = np.ceil(np.maximum(lower - low, 0) / width)
+        # bins of the old width needed to hold both the old range and the new values
+        needed = np.maximum((high - lower) / width, self.bins) + shift
+        factor = 2 ** np.maximum(np.ceil(np.log2(needed / self.bins)), 0).astype(np.int64)
+
+        index = (np.arange(self.bins) + shift[:, None].astype(np.int64)) // factor[:, None]
+        flat = (np.arange(len(spans))[:, None] * self.bins + index).reshape(-1)
+        counts = np.bincount(flat, self.counts[spans].reshape(-1), len(spans) * self.bins)
+        self.counts[spans] = counts.reshape(len(spans), self.bins).astype(np.int64)
+        self.lower[spans] = lower - shift * width
+        self.width[spans] = width * factor
+
+    def add(self, values: np.ndarray) -> None:
+        """
+        Accumulate values of shape (spans, n), NaN and infinite values are ignored
+        """
+        valid = np.isfinite(values)
+        values = np.where(valid, values, np.nan)
+        new = np.flatnonzero(np.isnan(self.lower) & valid.any(axis=1))
+        if len(new):
+            self._initialize(new, values[new])
+
+        # NaN for spans without finite values, which then compare False
+        low, high = np.fmin.reduce(values, axis=1), np.fmax.reduce(values, axis=1)
+        outside = np.flatnonzero((low < self.lower) | (high > self.lower + self.bins * self.width))
+        if len(outside):
+            self._grow(outside, low[outside], high[outside])
+
+        index = np.floor((values - self.lower[:, None]) / self.width[:, None])
+        index = np.clip(np.where(valid, index, 0), 0, self.bins - 1).astype(np.int64)
+        flat = (np.arange(self.spans)[:, None] * self.bins + index)[valid]
+        self.counts += np.bincount(flat, minlength=self.spans * self.bins).reshape(self.spans, self.bins)
+
+    def quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        """
+        Quantiles of every span, shape (len(quantiles), spans), NaN for spans without values
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        total = cumulative[:, -1]
+        result = np.empty((len(quantiles), self.spans))
+        for i, quantile in enumerate(quantiles):
+            target = quantile * total
+            bin_index = np.minimum(np.sum(cumulative < target[:, None], axis=1), self.bins - 1)
+            below = np.where(bin_index > 0, cumulative[np.arange(self.spans), bin_index - 1], 0)
+            inside = self.counts[np.arange(self.spans), bin_index]
+            fraction = np.where(inside > 0, (target - below) / np.maximum(inside, 1), 0.5)
+            result[i] = self.lower + (bin_index + fraction) * self.width
+        result[:, total == 0] = np.nan
+        return result
+
+
+def probabilistic_ampacity(
+    spans: int,
+    distributions: Mapping[str, Sampler],
+    samples: int = 10_000,
+    quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+    chunk_size: int = 1_000,
+    bins: int = 1024,
+    seed: Optional[int] = None,
+    **span_inputs: Any,
+) -> np.ndarray:
+    """
+    Monte Carlo quantiles of the conductor current of every span, shape (len(quantiles), spans).
+
+    ``distributions`` maps ``ConductorBatch`` inputs (e.g. ``wind_speed``) to samplers, see
+    ``normal``, ``uniform``, ``weibull`` and ``von_mises``. ``span_inputs`` are fixed inputs,
+    scalars or per-span arrays. Samples are drawn and rated ``chunk_size`` per span at a time
+    and folded into a ``QuantileHistogram``, so memory does not grow with ``samples``.
+    The same ``seed`` reproduces the same quantiles.
+    """
+    unknown = (set(distributions) | set(span_inputs)) - set(ConductorInputs)
+    if unknown:
+        raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+
+    rng = np.random.default_rng(seed)
+    fixed = {key: _per_span(value) if np.ndim(value) == 1 else value for key, value in span_inputs.items()}
+    histogram = QuantileHistogram(spans, bins)
+
+    for start in range(0, samples, chunk_size):
+        shape = (spans, min(chunk_size, samples - start))
+        drawn = {key: sampler(rng, shape) for key, sampler in distributions.items()}
+        current = ConductorBatch(**fixed, **drawn).conductor_current
+        histogram.add(np.broadcast_to(current, shape))
+
+    return histogram.quantiles(quantiles)
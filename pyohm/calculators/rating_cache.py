@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from pyohm.models.catalog import BatchInputs
+from pyohm.models.conductor import Conductor, ConductorSpec, ConductorState, DefaultConductorState
+
+# Default quantization step of each weather input, inputs not listed are used exactly.
+# ``date`` is quantized in seconds within its day.
+DefaultResolutions: dict[str, float] = {
+    "wind_speed": 0.1,
+    "wind_direction": 1.0,
+    "ambient_temperature": 0.1,
+    "conductor_surface_temperature": 0.1,
+    "date": 60.0,
+}
+
+
+def _quantize_date(date: datetime, resolution: float) -> datetime:
+    seconds = date.hour * 3600 + date.minute * 60 + date.second + date.microsecond * 1e-6
+    quantized = round(seconds / resolution) * resolution
+    return date if quantized == seconds else date + timedelta(seconds=quantized - seconds)
+
+
+class RatingCache:
+    """
+    Bounded LRU cache of ``Conductor.conductor_current``.
+
+    Queries are ``ConductorState`` inputs, optionally with a ``ConductorSpec`` for the conductor
+    data. Weather inputs are rounded to ``resolutions`` (see ``DefaultResolutions``) and the
+    rounded state is both the cache key and the state which is rated, so every query mapping to
+    a key gets the same rating. At most ``maxsize`` ratings are kept, the least recently used
+    is evicted first.
+
+    ``hits``, ``misses`` and ``evictions`` count queries and dropped entries since the last ``clear``.
+    """
+
+    def __init__(self, maxsize: int = 4096, resolutions: Optional[dict[str, float]] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        resolutions = DefaultResolutions if resolutions is None else resolutions
+        unknown = set(resolutions) - set(ConductorState._fields)
+        if unknown:
+            raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+
+        self.maxsize = maxsize
+        self.resolutions = dict(resolutions)
+        # (position in ConductorState, resolution) of the quantized numeric inputs
+        self._steps = [
+            (ConductorState._fields.index(field), resolution)
+            for field, resolution in self.resolutions.items()
+            if field != "date"
+        ]
+        self._date_resolution = self.resolutions.get("date")
+        self._date_index = ConductorState._fields.index("date")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._ratings: OrderedDict[ConductorState, float] = OrderedDict()
+        self._conductor = Conductor()
+
+    def __len__(self) -> int:
+        return len(self._ratings)
+
+    def __contains__(self, state: ConductorState) -> bool:
+        return self.key(state) in self._ratings
+
+    def key(self, state: ConductorState) -> ConductorState:
+        """
+        ``state`` with its weather inputs rounded to ``resolutions``
+        """
+        # the fields are heterogeneous, floats and the date
+        values: list[Any] = list(state)
+        for index, resolution in self._steps:
+            values[index] = round(values[index] / resolution) * resolution
+        if self._date_resolution is not None:
+            values[self._date_index] = _quantize_date(values[self._date_index], self._date_resolution)
+        return ConductorState._make(values)
+
+    def conductor_current(
+        self, state: ConductorState = DefaultConductorState, spec: Optional[ConductorSpec] = None, **inputs: Any
+    ) -> float:
+        """
+        Cached conductor current of ``state``, with the data of ``spec`` and ``inputs`` replacing its fields
+        """
+        if spec is not None:
+            inputs = {**{field: getattr(spec, column) for column, field in BatchInputs.items()}, **inputs}
+        if inputs:
+            state = state._replace(**inputs)
+
+        key = self.key(state)
+        rating = self._ratings.get(key)
+        if rating is not None:
+            self.hits += 1
+            self._ratings.move_to_end(key)
+            return rating
+
+        self.misses += 1
+        self._conductor.use_state(key)
+        rating = self._conductor.conductor_current
+        self._ratings[key] = rating
+        if len(self._ratings) > self.maxsize:
+            self._ratings.popitem(last=False)
+            self.evictions += 1
+        return rating
+
+    def invalidate(self, spec: Optional[ConductorSpec] = None, **inputs: Any) -> int:
+        """
+        Drop the cached ratings of a conductor type and/or with the given input values,
+        e.g. ``invalidate(latitude=30.0)``, or all ratings without arguments. Weather inputs are
+        rounded to ``resolutions`` as in ``key``. Returns the number of dropped ratings.
+        """
+        if spec is not None:
+            inputs = {**{field: getattr(spec, column) for column, field in BatchInputs.items()}, **inputs}
+        unknown = set(inputs) - set(ConductorState._fields)
+        if unknown:
+            raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+        quantized = self.key(DefaultConductorState._replace(**inputs))
+        inputs = {field: getattr(quantized, field) for field in inputs}
+
+        stale = [key for key in self._ratings if all(getattr(key, field) == value for field, value in inputs.items())]
+        for key in stale:
+            del self._ratings[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._ratings.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,251 @@
+import itertools
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.models.catalog import BatchInputs
+from pyohm.models.conductor import ConductorSpec
+from pyohm.models.conductor_batch import ConductorBatch, ConductorInputs
+
+PathLike = Union[str, Path]
+
+# Table axes in order, ``solar_heat_gain`` is q_s in W/m
+TableAxes: tuple[str, ...] = ("wind_speed", "wind_direction", "ambient_temperature", "solar_heat_gain")
+
+# Default grid of every axis, wind speeds are denser at low speeds where convection changes fastest
+DefaultAxes: dict[str, np.ndarray] = {
+    "wind_speed": np.linspace(0.0, np.sqrt(20.0), 41) ** 2,
+    "wind_direction": np.linspace(0.0, 360.0, 25),
+    "ambient_temperature": np.linspace(-40.0, 50.0, 19),
+    "solar_heat_gain": np.linspace(0.0, 40.0, 9),
+}
+
+# Axes interpolated linearly in the square root of their value, forced convection grows
+# about with the square root of the wind speed and fastest right above calm
+SquareRootAxes: frozenset[str] = frozenset({"wind_speed"})
+
+# Fractions of a grid interval at which the interpolation error along it is sampled
+EdgeFractions: tuple[float, ...] = (0.25, 0.5, 0.75)
+
+# Largest number of grid values ``RatingTable.build`` refines the axes to for a ``tolerance``
+MaxTableValues: int = 2**24
+
+
+def _coordinate(name: str, value: np.ndarray) -> np.ndarray:
+    """
+    Coordinate along which the axis ``name`` is interpolated linearly
+    """
+    return np.sqrt(value) if name in SquareRootAxes else value
+
+
+def _value(name: str, coordinate: np.ndarray) -> np.ndarray:
+    return np.square(coordinate) if name in SquareRootAxes else coordinate
+
+
+def _heat_loss(axes: list[np.ndarray], inputs: dict[str, Any]) -> tuple[np.ndarray, float]:
+    """
+    q_c + q_r (W/m) on the outer product of the wind speed, wind direction and ambient temperature
+    ``axes``, and R_avg (ohm/m) which only depends on the fixed inputs
+    """
+    wind_speed, wind_direction, ambient_temperature = axes
+    batch = ConductorBatch(
+        **inputs,
+        wind_speed=wind_speed[:, None, None],
+        wind_direction=wind_direction[None, :, None],
+        ambient_temperature=ambient_temperature[None, None, :],
+    )
+    heat_loss = np.asarray(batch.forced_convection_heat_loss + batch.radiated_heat_loss, dtype=np.float64)
+    return heat_loss, float(batch.average_resistance)
+
+
+def _cell_reduce(function: np.ufunc, values: np.ndarray, axis: int) -> np.ndarray:
+    """
+    ``function`` of the two nodes bounding every interval of ``axis``
+    """
+    n = values.shape[axis]
+    return np.asarray(
+        function(np.take(values, np.arange(n - 1), axis=axis), np.take(values, np.arange(1, n), axis=axis))
+    )
+
+
+def _edge_errors(grid: list[np.ndarray], inputs: dict[str, Any], heat_loss: np.ndarray) -> list[np.ndarray]:
+    """
+    Error (W/m) of the heat loss interpolated along each weather axis, per cell of the weather grid:
+    the largest error on the four cell edges along the axis, sampled at ``EdgeFractions``
+    """
+    errors = []
+    for i, (name, axis) in enumerate(zip(TableAxes, grid)):
+        lower = np.take(heat_loss, np.arange(len(axis) - 1), axis=i)
+        upper = np.take(heat_loss, np.arange(1, len(axis)), axis=i)
+        error = np.zeros(lower.shape)
+        coordinate = _coordinate(name, axis)
+        for fraction in EdgeFractions:
+            points = list(grid)
+            points[i] = _value(name, coordinate[:-1] + fraction * np.diff(coordinate))
+            sampled, _ = _heat_loss(points, inputs)
+            error = np.maximum(error, np.abs(sampled - (lower + fraction * (upper - lower))))
+        for j in range(len(grid)):
+            if j != i:
+                error = _cell_reduce(np.maximum, error, j)
+        errors.append(error)
+    return errors
+
+
+def _current(squared_current: np.ndarray) -> np.ndarray:
+    return np.asarray(np.sqrt(np.maximum(squared_current, 0.0)))
+
+
+def _error_bounds(values: np.ndarray, edge_errors: list[np.ndarray], resistance: float) -> np.ndarray:
+    """
+    Bound (A) of the interpolated current against the physics, per grid cell.
+
+    The interpolated squared current is off by at most ``delta``, the sum of the edge errors
+    over R_avg plus the rounding of ``values``, as it is exact along ``solar_heat_gain``.
+    Clamped at zero, the currents then differ by at most delta / sqrt(max(low, delta)) and
+    sqrt(high + delta), ``low`` and ``high`` being the smallest and largest corner of the cell.
+    """
+    low = high = np.asarray(values, dtype=np.float64)
+    for axis in range(values.ndim):
+        low, high = _cell_reduce(np.minimum, low, axis), _cell_reduce(np.maximum, high, axis)
+    rounding = np.finfo(values.dtype).eps * np.maximum(np.abs(low), np.abs(high))
+    delta = (np.sum(edge_errors, axis=0) / resistance)[..., None] + rounding
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray(np.fmin(delta / np.sqrt(np.maximum(low, delta)), np.sqrt(np.maximum(high + delta, 0.0))))
+
+
+class RatingTable:
+    """
+    Conductor current of one conductor on a rectilinear grid of ``TableAxes``,
+    looked up by multilinear interpolation without evaluating the physics.
+
+    ``values`` holds the squared current, which is linear in ``solar_heat_gain`` so that axis
+    is interpolated exactly, and stays finite where the heat balance has no solution.
+    The axes in ``SquareRootAxes`` are interpolated linearly in the square root of their value.
+    ``error_bound`` is the largest absolute error (A) of a lookup inside the grid against the
+    physics, where no current is sustainable the physics counts as 0 A. It is derived when the
+    table is built from the interpolation error along the edges of every grid cell, see ``build``.
+    """
+
+    def __init__(self, axes: dict[str, np.ndarray], values: np.ndarray, error_bound: float) -> None:
+        self.axes = [np.asarray(axes[name], dtype=np.float64) for name in TableAxes]
+        self._coordinates = [_coordinate(name, axis) for name, axis in zip(TableAxes, self.axes)]
+        self.values = values
+        self.error_bound = error_bound
+
+    @classmethod
+    def build(
+        cls,
+        spec: Optional[ConductorSpec] = None,
+        axes: Optional[dict[str, npt.ArrayLike]] = None,
+        dtype: npt.DTypeLike = np.float32,
+        tolerance: Optional[float] = None,
+        **inputs: Any,
+    ) -> "RatingTable":
+        """
+        Sweep ``ConductorBatch`` over ``axes`` (defaults to ``DefaultAxes``, per axis) for the
+        conductor data of ``spec`` and the other fixed ``inputs`` (e.g. ``elevation``).
+        ``solar_heat_gain`` replaces the solar geometry so date and latitude are not used.
+
+        The error of the heat loss interpolated along every cell edge of the weather axes is
+        sampled at ``EdgeFractions`` of the edge, the sum over the axes bounds the error of the
+        squared current in the cell. With ``tolerance`` (A) the weather axes are bisected where
+        cells exceed it until ``error_bound`` meets it, a ``ValueError`` is raised if that takes
+        more than ``MaxTableValues`` values.
+        """
+        axes = {**DefaultAxes, **(axes or {})}
+        unknown = set(axes) - set(TableAxes)
+        if unknown:
+            raise TypeError(f"Unknown table axes: {sorted(unknown)}")
+        unknown = set(inputs) - set(ConductorInputs)
+        if unknown:
+            raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+        if spec is not None:
+            inputs = {**{field: getattr(spec, column) for column, field in BatchInputs.items()}, **inputs}
+
+        grid = [np.asarray(axes[name], dtype=np.float64) for name in TableAxes]
+        if any(axis.ndim != 1 or len(axis) < 2 or np.any(np.diff(axis) <= 0) for axis in grid):
+            raise ValueError("Every axis needs at least two strictly increasing values")
+        if any(np.any(axis < 0) for name, axis in zip(TableAxes, grid) if name in SquareRootAxes):
+            raise ValueError(f"Axes {sorted(SquareRootAxes)} must not be negative")
+
+        weather, solar_heat_gain = grid[:3], grid[3]
+        while True:
+            heat_loss, resistance = _heat_loss(weather, inputs)
+            values = ((heat_loss[..., None] - solar_heat_gain) / resistance).astype(dtype)
+            edge_errors = _edge_errors(weather, inputs, heat_loss)
+            bounds = _error_bounds(values, edge_errors, resistance)
+            error_bound = float(bounds.max())
+            if tolerance is None or error_bound <= tolerance:
+                return cls(dict(zip(TableAxes, [*weather, solar_heat_gain])), values, error_bound)
+
+            # bisect the intervals of every axis with at least a third of the error of a cell above tolerance
+            exceeded = np.any(bounds > tolerance, axis=3)
+            total = np.sum(edge_errors, axis=0)
+            for i, error in enumerate(edge_errors):
+                split = np.any(exceeded & (error >= total / 3), axis=tuple(j for j in range(3) if j != i))
+                coordinate = _coordinate(TableAxes[i], weather[i])
+                middle = _value(TableAxes[i], (coordinate[:-1] + coordinate[1:])[split] / 2)
+                weather[i] = np.sort(np.concatenate([weather[i], middle]))
+            if np.prod([len(axis) for axis in (*weather, solar_heat_gain)]) > MaxTableValues:
+                raise ValueError(
+                    f"A table meeting the tolerance {tolerance} A needs more than {MaxTableValues} values, "
+                    f"the error bound is {error_bound:.3g} A"
+                )
+
+    def lookup(
+        self,
+        wind_speed: npt.ArrayLike,
+        wind_direction: npt.ArrayLike,
+        ambient_temperature: npt.ArrayLike,
+        solar_heat_gain: npt.ArrayLike,
+    ) -> np.ndarray:
+        """
+        Interpolated conductor current, inputs broadcast against each other.
+        NaN outside the grid and 0 A where the interpolated heat balance has no solution.
+        """
+        values = (wind_speed, wind_direction, ambient_temperature, solar_heat_gain)
+        points = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in values))
+        lower: list[np.ndarray] = []
+        weight: list[np.ndarray] = []
+        outside = np.zeros(points[0].shape, dtype=bool)
+        for name, axis, coordinate, value in zip(TableAxes, self.axes, self._coordinates, points):
+            outside |= (value < axis[0]) | (value > axis[-1]) | np.isnan(value)
+            with np.errstate(invalid="ignore"):
+                value = _coordinate(name, value)
+            index = np.clip(np.searchsorted(coordinate, value, side="right") - 1, 0, len(axis) - 2)
+            lower.append(index)
+            weight.append((value - coordinate[index]) / (coordinate[index + 1] - coordinate[index]))
+
+        squared_current = np.zeros(points[0].shape)
+        for corner in itertools.product((0, 1), repeat=len(TableAxes)):
+            corner_weight = np.ones(points[0].shape)
+            for offset, w in zip(corner, weight):
+                corner_weight *= w if offset else 1 - w
+            corner_index = tuple(index + offset for index, offset in zip(lower, corner))
+            squared_current += corner_weight * self.values[corner_index]
+        squared_current[outside] = np.nan
+        return _current(squared_current)
+
+    def save(self, path: PathLike) -> None:
+        """
+        Save to the directory ``path``, values as ``values.npy`` and axes as ``axes.npz``
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "values.npy", np.asarray(self.values))
+        arrays: dict[str, Any] = {"error_bound": self.error_bound, **dict(zip(TableAxes, self.axes))}
+        np.savez(path / "axes.npz", **arrays)
+
+    @classmethod
+    def load(cls, path: PathLike, mmap: bool = True) -> "RatingTable":
+        """
+        Load a saved table, with ``mmap`` the values are memory-mapped read-only and
+        only the pages around looked up points are read from disk.
+        """
+        path = Path(path)
+        with np.load(path / "axes.npz") as axes:
+            error_bound = float(axes["error_bound"])
+            grid = {name: axes[name] for name in TableAxes}
+        return cls(grid, np.load(path / "values.npy", mmap_mode="r" if mmap else None), error_bound)
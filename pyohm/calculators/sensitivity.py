@@ -0,0 +1,76 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+class AmpacitySensitivities(NamedTuple):
+    # I, conductor current (A)
+    conductor_current: np.ndarray
+
+    # dI/d(wind_speed), A per m/s
+    wind_speed: np.ndarray
+
+    # dI/d(wind_direction), A per degree
+    wind_direction: np.ndarray
+
+    # dI/d(ambient_temperature), A per °C
+    ambient_temperature: np.ndarray
+
+    # dI/d(q_s), A per W/m of solar heat gain
+    solar_heat_gain: np.ndarray
+
+
+def ampacity_sensitivities(batch: ConductorBatch) -> AmpacitySensitivities:
+    """
+    Conductor current of the batch and its analytic derivatives with respect to the weather.
+
+    The derivatives are propagated forward through the heat balance
+    I = sqrt((q_c + q_r - q_s) / R_avg), reusing the cached intermediates of the batch
+    (N_Re, k_f, K_angle, q_c, ...), so the cost is close to a single rating.
+    """
+    I = batch.conductor_current
+    N_Re = batch.reynolds_number
+    K_angle = batch.wind_direction_factor
+    k_f = batch.air_thermal_conductivity
+    T_film = batch.t_film
+    delta_temperature = batch.conductor_surface_temperature - batch.ambient_temperature
+
+    # forced convection q_c = K_angle * k_f * ΔT * max(q_c1, q_c2), with Nusselt-like factors
+    q_c1 = 1.05 + 1.35 * N_Re**0.52
+    q_c2 = 0.754 * N_Re**0.6
+    first = q_c1 * delta_temperature >= q_c2 * delta_temperature
+    factor = np.where(first, q_c1, q_c2)
+    dfactor_dN_Re = np.where(first, 1.35 * 0.52 * N_Re**-0.48, 0.754 * 0.6 * N_Re**-0.4)
+
+    # N_Re = D * ρ_f * V / µ_f
+    dN_Re_dV = batch.conductor_outside_diameter * batch.air_density / batch.air_viscosity
+    dq_c_dV = K_angle * k_f * delta_temperature * dfactor_dN_Re * dN_Re_dV
+
+    phi = np.radians(batch.wind_direction)
+    dK_angle_dphi = np.radians(1.0) * (np.sin(phi) - 0.388 * np.sin(2 * phi) + 0.736 * np.cos(2 * phi))
+    dq_c_dphi = dK_angle_dphi * k_f * delta_temperature * factor
+
+    # T_film = (T_max + T_a) / 2 drives ρ_f, µ_f and k_f
+    dT_film = 0.5
+    drho = -0.00367 / (1 + 0.00367 * T_film) * dT_film
+    dmu = (1.5 / (T_film + 273) - 1 / (T_film + 383.4)) * dT_film
+    dN_Re_dT_a = N_Re * (drho - dmu)
+    dk_f_dT_a = (7.477e-5 - 2 * 4.407e-9 * T_film) * dT_film
+    dq_c_dT_a = K_angle * (
+        dk_f_dT_a * delta_temperature * factor - k_f * factor + k_f * delta_temperature * dfactor_dN_Re * dN_Re_dT_a
+    )
+    dq_r_dT_a = (
+        -17.8 * batch.conductor_outside_diameter * batch.emissivity * 4 * ((batch.ambient_temperature + 273) / 100) ** 3
+    ) / 100
+
+    # dI/dx = d(q_c + q_r - q_s)/dx / (2 * I * R_avg)
+    scale = 1 / (2 * I * batch.average_resistance)
+    return AmpacitySensitivities(
+        conductor_current=I,
+        wind_speed=dq_c_dV * scale,
+        wind_direction=dq_c_dphi * scale,
+        ambient_temperature=(dq_c_dT_a + dq_r_dT_a) * scale,
+        solar_heat_gain=-scale,
+    )
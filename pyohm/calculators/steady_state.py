@@ -0,0 +1,122 @@
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def heat_balance(batch: ConductorBatch, current: npt.ArrayLike) -> np.ndarray:
+    """
+    Net heat flow q_c + q_r - q_s - I^2 * R_avg (W/m) at the batch surface temperature,
+    zero when the conductor is in thermal equilibrium.
+    """
+    current = np.asarray(current)
+    return batch.q_c + batch.q_r - batch.q_s - current**2 * batch.R_avg
+
+
+def convection_coefficients(batch: ConductorBatch) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Forced convection heat loss per degree (W/m-°C) for a conductor hotter and colder than
+    the ambient air, q_c = coefficient * (T_s - T_a).
+    """
+    N_Re = batch.reynolds_number
+    q_c1 = 1.05 + 1.35 * N_Re**0.52
+    q_c2 = 0.754 * N_Re**0.6
+    factor = batch.wind_direction_factor * batch.air_thermal_conductivity
+    return factor * np.maximum(q_c1, q_c2), factor * np.minimum(q_c1, q_c2)
+
+
+def heat_balance_derivative(batch: ConductorBatch, current: npt.ArrayLike) -> np.ndarray:
+    """
+    d(heat_balance)/dT_s, derivative of the net heat flow with respect to surface temperature
+    """
+    current = np.asarray(current)
+    heating, cooling = convection_coefficients(batch)
+    dq_c = np.where(batch.conductor_surface_temperature >= batch.ambient_temperature, heating, cooling)
+    dq_r = (
+        17.8
+        * batch.conductor_outside_diameter
+        * batch.emissivity
+        * 4
+        * ((batch.conductor_surface_temperature + 273) / 100) ** 3
+        / 100
+    )
+    return np.asarray(dq_c + dq_r - current**2 * resistance_slope(batch))
+
+
+def resistance_slope(batch: ConductorBatch) -> np.ndarray:
+    """
+    dR/dT, change of AC resistance per degree (ohm/m-°C)
+    """
+    return (batch.conductor_ac_resistance_high - batch.conductor_ac_resistance_low) / (
+        batch.conductor_high_temperature - batch.conductor_low_temperature
+    )
+
+
+def solve_conductor_temperature(
+    batch: ConductorBatch,
+    current: npt.ArrayLike,
+    initial_temperature: Optional[npt.ArrayLike] = None,
+    maximum_temperature: float = 500.0,
+    tolerance: float = 1e-6,
+    max_iterations: int = 50,
+    residual_tolerance: float = 1e-9,
+) -> np.ndarray:
+    """
+    Steady-state conductor surface temperature (°C) carrying ``current`` (A).
+
+    The heat balance is solved element-wise with a bracketed Newton method, the bracket
+    starts at [ambient_temperature - 100, maximum_temperature] and Newton steps leaving it
+    fall back to bisection. Pass the previous solution as ``initial_temperature`` to warm
+    start repeated solves. Elements without a root inside the bracket are NaN.
+
+    Iteration stops once every step is within ``tolerance`` (°C) and every heat balance
+    residual is within ``residual_tolerance`` of the heat input q_s + I^2 * R_avg, so the
+    current of the solved temperature matches ``current`` closely even near ambient, where
+    a small temperature error is a large share of the temperature rise.
+
+    The batch is left with ``conductor_surface_temperature`` set to the solution.
+    """
+    current = np.asarray(current, dtype=np.float64)
+    shape = np.broadcast_shapes(batch.shape, current.shape)
+
+    lower = np.broadcast_to(batch.ambient_temperature - 100.0, shape).copy()
+    upper = np.full(shape, maximum_temperature, dtype=np.float64)
+
+    batch.conductor_surface_temperature = lower
+    valid = heat_balance(batch, current) <= 0
+    batch.conductor_surface_temperature = upper
+    valid &= heat_balance(batch, current) >= 0
+
+    if initial_temperature is None:
+        temperature = batch.max_allowable_conductor_temperature + np.zeros(shape)
+    else:
+        temperature = np.broadcast_to(np.asarray(initial_temperature, dtype=np.float64), shape).copy()
+    temperature = np.where((temperature > lower) & (temperature < upper), temperature, (lower + upper) / 2)
+
+    for _ in range(max_iterations):
+        batch.conductor_surface_temperature = temperature
+        balance = heat_balance(batch, current)
+        derivative = heat_balance_derivative(batch, current)
+
+        lower = np.where(balance < 0, temperature, lower)
+        upper = np.where(balance > 0, temperature, upper)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = temperature - balance / derivative
+        inside = (derivative > 0) & (newton >= lower) & (newton <= upper)
+        next_temperature = np.where(inside, newton, (lower + upper) / 2)
+        next_temperature = np.where(balance == 0, temperature, next_temperature)
+
+        heat_input = batch.q_s + current**2 * batch.R_avg
+        settled = np.abs(next_temperature - temperature) <= tolerance
+        balanced = np.abs(balance) <= residual_tolerance * heat_input
+        converged = np.all((settled & balanced)[valid])
+        temperature = next_temperature
+        if converged:
+            break
+
+    temperature = np.where(valid, temperature, np.nan)
+    batch.conductor_surface_temperature = temperature
+    return temperature
@@ -0,0 +1,98 @@
+from typing import Callable, Mapping, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.calculators.steady_state import convection_coefficients, resistance_slope
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def temperature_rate(batch: ConductorBatch, current: npt.ArrayLike) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    dT_s/dt (°C/s) of the IEEE 738 transient heat balance for the batch inputs,
+    mCp * dT_s/dt = I^2 * R(T_s) + q_s - q_c(T_s) - q_r(T_s)
+
+    Every term which does not depend on the conductor temperature is evaluated once, the
+    returned function only does the temperature dependent arithmetic.
+    """
+    current_squared = np.asarray(current, dtype=np.float64) ** 2
+    heating, cooling = convection_coefficients(batch)
+    ambient_temperature = batch.ambient_temperature
+    radiation = 17.8 * batch.conductor_outside_diameter * batch.emissivity
+    ambient_radiation = ((ambient_temperature + 273) / 100) ** 4
+    slope = resistance_slope(batch)
+    resistance_offset = batch.conductor_ac_resistance_low - slope * batch.conductor_low_temperature
+    gain = batch.q_s + current_squared * resistance_offset
+    heat_capacity = batch.conductor_heat_capacity
+
+    def rate(temperature: np.ndarray) -> np.ndarray:
+        delta_temperature = temperature - ambient_temperature
+        q_c = delta_temperature * np.where(delta_temperature >= 0, heating, cooling)
+        q_r = radiation * (((temperature + 273) / 100) ** 4 - ambient_radiation)
+        return np.asarray((gain + current_squared * slope * temperature - q_c - q_r) / heat_capacity)
+
+    return rate
+
+
+def simulate_transient(
+    batch: ConductorBatch,
+    time: npt.ArrayLike,
+    current: npt.ArrayLike,
+    initial_temperature: npt.ArrayLike,
+    weather: Optional[Mapping[str, npt.ArrayLike]] = None,
+    time_step: float = 1.0,
+    adaptive: bool = True,
+    tolerance: float = 1e-3,
+) -> np.ndarray:
+    """
+    Conductor surface temperature (°C) over a current/weather time series.
+
+    ``time`` holds the sample times in seconds, ``current`` and every array in ``weather``
+    (keyed by ``ConductorBatch`` input name) have the samples along their first axis and the
+    spans along the remaining axes. Inputs are held constant between samples and all spans
+    advance in lock-step.
+
+    With ``adaptive`` the Heun-Euler pair adapts the step, starting at ``time_step``, so the local
+    error of every span stays below ``tolerance`` (°C). Otherwise forward Euler runs with a
+    fixed step of at most ``time_step``.
+
+    Returns the temperature at every sample time, shape (samples, *spans).
+    """
+    time = np.asarray(time, dtype=np.float64)
+    current = np.asarray(current, dtype=np.float64)
+    series = {key: np.asarray(value) for key, value in (weather or {}).items()}
+
+    temperature = np.broadcast_to(
+        np.asarray(initial_temperature, dtype=np.float64), np.broadcast_shapes(batch.shape, current.shape[1:])
+    ).copy()
+    temperatures = np.empty((len(time), *temperature.shape))
+    temperatures[0] = temperature
+
+    step = time_step
+    for sample in range(len(time) - 1):
+        for key, value in series.items():
+            setattr(batch, key, value[sample])
+        rate = temperature_rate(batch, current[sample])
+
+        duration = time[sample + 1] - time[sample]
+        if adaptive:
+            elapsed = 0.0
+            while elapsed < duration:
+                step = min(step, duration - elapsed)
+                k1 = rate(temperature)
+                k2 = rate(temperature + step * k1)
+                error = float(np.max(np.abs(k2 - k1))) * step / 2
+                if error <= tolerance or step <= 1e-6:
+                    temperature = temperature + step * (k1 + k2) / 2
+                    elapsed += step
+                scale = 5.0 if error == 0 else min(5.0, max(0.2, 0.9 * (tolerance / error) ** 0.5))
+                step = step * scale
+        else:
+            steps = max(int(np.ceil(duration / time_step)), 1)
+            dt = duration / steps
+            for _ in range(steps):
+                temperature = temperature + dt * rate(temperature)
+
+        temperatures[sample + 1] = temperature
+
+    return temperatures
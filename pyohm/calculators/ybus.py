@@ -0,0 +1,137 @@
+from typing import NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    import scipy.sparse
+except ImportError:  # pragma: no cover - scipy is an optional dependency
+    scipy = None
+
+
+class BranchAdmittances(NamedTuple):
+    # Y_ff, self admittance at the from end of every branch (p.u.)
+    from_from: np.ndarray
+
+    # Y_ft, transfer admittance from the to end to the from end
+    from_to: np.ndarray
+
+    # Y_tf, transfer admittance from the from end to the to end
+    to_from: np.ndarray
+
+    # Y_tt, self admittance at the to end
+    to_to: np.ndarray
+
+
+class CSRMatrix(NamedTuple):
+    """
+    Complex sparse matrix in compressed sparse row form, the columns of row ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]`` in increasing order.
+    """
+
+    indptr: np.ndarray
+
+    indices: np.ndarray
+
+    data: np.ndarray
+
+    shape: tuple[int, int]
+
+    def dot(self, vector: npt.ArrayLike) -> np.ndarray:
+        """
+        Matrix-vector product, e.g. bus injection currents ``I = Ybus.dot(V)``
+        """
+        products = self.data * np.asarray(vector)[self.indices]
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return np.bincount(rows, products.real, self.shape[0]) + 1j * np.bincount(rows, products.imag, self.shape[0])
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        dense[np.repeat(np.arange(self.shape[0]), np.diff(self.indptr)), self.indices] = self.data
+        return dense
+
+    def to_scipy(self) -> "scipy.sparse.csr_matrix":
+        """
+        ``scipy.sparse.csr_matrix`` sharing the arrays, requires scipy
+        """
+        if scipy is None:
+            raise ImportError("scipy is required for to_scipy")
+        return scipy.sparse.csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+def branch_admittances(
+    resistance: npt.ArrayLike,
+    reactance: npt.ArrayLike,
+    charging: npt.ArrayLike = 0.0,
+    tap: npt.ArrayLike = 1.0,
+    shift: npt.ArrayLike = 0.0,
+) -> BranchAdmittances:
+    """
+    Two-port admittances of lines and transformers in the standard pi model (p.u.).
+
+    ``charging`` is the total line charging susceptance, ``tap`` the off-nominal turns ratio at
+    the from end (0 means 1, as for lines) and ``shift`` the phase shift in degrees.
+    Raises ``ValueError`` naming the branches with zero series impedance.
+    """
+    impedance = np.asarray(resistance, dtype=np.float64) + 1j * np.asarray(reactance, dtype=np.float64)
+    zero = np.flatnonzero(impedance == 0)
+    if len(zero):
+        raise ValueError(f"Branches {zero.tolist()} have zero series impedance")
+    series = 1 / impedance
+    tap = np.asarray(tap, dtype=np.float64)
+    ratio = np.where(tap == 0, 1.0, tap) * np.exp(1j * np.radians(shift))
+    to_to = series + 0.5j * np.asarray(charging, dtype=np.float64)
+    return BranchAdmittances(
+        from_from=to_to / (ratio * np.conj(ratio)),
+        from_to=-series / np.conj(ratio),
+        to_from=-series / ratio,
+        to_to=to_to,
+    )
+
+
+def build_ybus(
+    buses: int,
+    from_bus: npt.ArrayLike,
+    to_bus: npt.ArrayLike,
+    resistance: npt.ArrayLike,
+    reactance: npt.ArrayLike,
+    charging: npt.ArrayLike = 0.0,
+    tap: npt.ArrayLike = 1.0,
+    shift: npt.ArrayLike = 0.0,
+    in_service: Optional[npt.ArrayLike] = None,
+    bus_shunt: Optional[npt.ArrayLike] = None,
+) -> CSRMatrix:
+    """
+    Bus admittance matrix of ``buses`` buses (0-based) connected by branches.
+
+    Branch arrays (end buses, series impedance, charging, tap and shift, see
+    ``branch_admittances``) broadcast against each other, ``in_service`` masks out branches and
+    ``bus_shunt`` adds G + jB per bus (p.u.). Zero impedance is only an error for branches in
+    service, numbered among those. All entries are assembled as COO triplets and
+    summed into CSR in one sort, without Python loops over branches.
+    """
+    from_bus, to_bus, *parameters = np.broadcast_arrays(
+        np.asarray(from_bus, dtype=np.int64),
+        np.asarray(to_bus, dtype=np.int64),
+        *(np.asarray(parameter, dtype=np.float64) for parameter in (resistance, reactance, charging, tap, shift)),
+    )
+    if in_service is not None:
+        # out of service branches may lack impedance data, leave them out before validating
+        mask = np.broadcast_to(np.asarray(in_service, dtype=bool), from_bus.shape)
+        from_bus, to_bus, parameters = from_bus[mask], to_bus[mask], [parameter[mask] for parameter in parameters]
+    values = branch_admittances(*parameters)
+    ends = np.concatenate([from_bus, to_bus])
+    if len(ends) and (ends.min() < 0 or ends.max() >= buses):
+        raise ValueError(f"Bus indices must be within [0, {buses})")
+
+    diagonal = np.arange(buses)
+    shunt = np.zeros(buses, dtype=np.complex128) if bus_shunt is None else np.broadcast_to(bus_shunt, buses)
+    rows = np.concatenate([from_bus, from_bus, to_bus, to_bus, diagonal])
+    columns = np.concatenate([from_bus, to_bus, from_bus, to_bus, diagonal])
+    data = np.concatenate([*values, shunt]).astype(np.complex128)
+
+    keys, inverse = np.unique(rows * buses + columns, return_inverse=True)
+    summed = np.bincount(inverse, data.real, len(keys)) + 1j * np.bincount(inverse, data.imag, len(keys))
+    indptr = np.zeros(buses + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys // buses, minlength=buses), out=indptr[1:])
+    return CSRMatrix(indptr, keys % buses, summed, (buses, buses))
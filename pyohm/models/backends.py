@@ -0,0 +1,195 @@
+import importlib.util
+import math
+import types
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+
+from pyohm.models.solar import SolarHeatIntensityCoefficients
+
+if TYPE_CHECKING:
+    from pyohm.models.conductor_batch import ConductorBatch
+
+# backend(batch) -> conductor current of every batch element, shape batch.shape
+Backend = Callable[["ConductorBatch"], np.ndarray]
+
+# Registered heat-balance kernel backends by name
+Backends: dict[str, Backend] = {}
+
+# Backends tried in order when none is requested, numba only runs when asked for by name
+DefaultBackends: tuple[str, ...] = ("numpy",)
+
+# Loop range of ``heat_balance_kernel``, swapped for ``numba.prange`` when the kernel is compiled
+prange = range
+
+# ConductorBatch inputs passed to element-wise kernels, followed by number_of_day and hour
+KernelInputs: tuple[str, ...] = (
+    "wind_speed",
+    "wind_direction",
+    "emissivity",
+    "solar_absorption",
+    "ambient_temperature",
+    "conductor_surface_temperature",
+    "max_allowable_conductor_temperature",
+    "conductor_outside_diameter",
+    "conductor_low_temperature",
+    "conductor_high_temperature",
+    "conductor_ac_resistance_low",
+    "conductor_ac_resistance_high",
+    "azimuth_of_conductor",
+    "latitude",
+    "clear_atmosphere",
+    "elevation",
+)
+
+
+def register_backend(name: str, backend: Backend) -> None:
+    Backends[name] = backend
+
+
+def available_backends() -> list[str]:
+    return list(Backends)
+
+
+def get_backend(name: Optional[str] = None) -> Backend:
+    """
+    Backend by name, or the first available of ``DefaultBackends``
+    """
+    if name is None:
+        name = next(backend for backend in DefaultBackends if backend in Backends)
+    try:
+        return Backends[name]
+    except KeyError:
+        raise KeyError(f"Unknown backend '{name}', available backends are {available_backends()}") from None
+
+
+def kernel_arrays(batch: "ConductorBatch") -> list[np.ndarray]:
+    """
+    ``KernelInputs``, number_of_day and hour of the batch as flat arrays of equal length in ``batch.dtype``
+    """
+    shape = batch.shape
+    values = [getattr(batch, key) for key in KernelInputs] + [batch.number_of_day, batch.hour]
+    return [np.broadcast_to(np.asarray(value, dtype=batch.dtype), shape).reshape(-1) for value in values]
+
+
+def numpy_backend(batch: "ConductorBatch") -> np.ndarray:
+    """
+    ``ConductorBatch.conductor_current``, one NumPy array operation per formula step
+    """
+    return np.broadcast_to(batch.conductor_current, batch.shape)
+
+
+register_backend("numpy", numpy_backend)
+
+
+def heat_balance_kernel(
+    wind_speed: np.ndarray,
+    wind_direction: np.ndarray,
+    emissivity: np.ndarray,
+    solar_absorption: np.ndarray,
+    ambient_temperature: np.ndarray,
+    conductor_surface_temperature: np.ndarray,
+    max_allowable_conductor_temperature: np.ndarray,
+    conductor_outside_diameter: np.ndarray,
+    conductor_low_temperature: np.ndarray,
+    conductor_high_temperature: np.ndarray,
+    conductor_ac_resistance_low: np.ndarray,
+    conductor_ac_resistance_high: np.ndarray,
+    azimuth_of_conductor: np.ndarray,
+    latitude: np.ndarray,
+    clear_atmosphere: np.ndarray,
+    elevation: np.ndarray,
+    number_of_day: np.ndarray,
+    hour: np.ndarray,
+    coefficients: np.ndarray,
+    current: np.ndarray,
+) -> None:
+    """
+    Fused element-wise ``Conductor.conductor_current``, written to ``current`` without temporaries.
+    Plain Python, compiled by the numba backend which runs the loop on all cores.
+    """
+    for i in prange(current.shape[0]):
+        t_film = (max_allowable_conductor_temperature[i] + ambient_temperature[i]) / 2
+        air_density = (1.293 - 1.525e-4 * elevation[i] + 6.379e-9 * elevation[i] ** 2) / (1 + 0.00367 * t_film)
+        air_viscosity = (1.458e-6 * (t_film + 273) ** 1.5) / (t_film + 383.4)
+        air_thermal_conductivity = 2.424e-2 + 7.477e-5 * t_film - 4.407e-9 * t_film**2
+        diameter = conductor_outside_diameter[i]
+        delta_temperature = conductor_surface_temperature[i] - ambient_temperature[i]
+
+        phi = math.radians(wind_direction[i])
+        cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+        # cos(2φ) and sin(2φ) from the double angle identities
+        wind_direction_factor = 1.194 - cos_phi + 0.194 * (2 * cos_phi**2 - 1) + 0.368 * (2 * sin_phi * cos_phi)
+        log_reynolds_number = math.log(diameter * air_density * wind_speed[i] / air_viscosity)
+        q_c = wind_direction_factor * air_thermal_conductivity * delta_temperature
+        q_c = max(
+            q_c * (1.05 + 1.35 * math.exp(0.52 * log_reynolds_number)),
+            q_c * 0.754 * math.exp(0.6 * log_reynolds_number),
+        )
+
+        surface = ((conductor_surface_temperature[i] + 273) / 100) ** 2
+        ambient = ((ambient_temperature[i] + 273) / 100) ** 2
+        q_r = 17.8 * diameter * emissivity[i] * (surface * surface - ambient * ambient)
+
+        declination = math.radians(23.45 * math.sin(math.radians(((284 + number_of_day[i]) / 365) * 360)))
+        omega = math.radians((hour[i] - 12) * 15)
+        phi = math.radians(latitude[i])
+        solar_altitude = math.degrees(
+            math.asin(math.cos(phi) * math.cos(declination) * math.cos(omega) + math.sin(phi) * math.sin(declination))
+        )
+        row = 1 if clear_atmosphere[i] else 0
+        intensity = coefficients[row, 6]
+        for j in range(5, -1, -1):
+            intensity = intensity * solar_altitude + coefficients[row, j]
+        intensity *= 1 + 1.148e-4 * elevation[i] + (-1.108e-8 * elevation[i] ** 2)
+        theta = math.acos(
+            math.cos(math.radians(solar_altitude)) * math.cos(math.radians(solar_altitude - azimuth_of_conductor[i]))
+        )
+        q_s = solar_absorption[i] * intensity * math.sin(theta) * diameter
+
+        resistance = (
+            (conductor_ac_resistance_high[i] - conductor_ac_resistance_low[i])
+            / (conductor_high_temperature[i] - conductor_low_temperature[i])
+        ) * (conductor_surface_temperature[i] - conductor_low_temperature[i]) + conductor_ac_resistance_low[i]
+
+        balance = (q_c + q_r - q_s) / resistance
+        current[i] = math.sqrt(balance) if balance >= 0 else math.nan
+
+
+# heat_balance_kernel compiled by numba, None until the numba backend first runs
+_compiled_heat_balance_kernel: Optional[Callable[..., None]] = None
+
+
+def _compile_heat_balance_kernel() -> Callable[..., None]:
+    """
+    Import numba and compile ``heat_balance_kernel`` with ``numba.prange`` as its loop range,
+    once, on first use, so importing pyohm does not pay for either
+    """
+    global _compiled_heat_balance_kernel
+    if _compiled_heat_balance_kernel is None:
+        import numba
+
+        kernel = types.FunctionType(
+            heat_balance_kernel.__code__, {**heat_balance_kernel.__globals__, "prange": numba.prange}
+        )
+        _compiled_heat_balance_kernel = numba.njit(nogil=True, parallel=True, error_model="numpy")(kernel)
+    return _compiled_heat_balance_kernel
+
+
+def numba_backend(batch: "ConductorBatch") -> np.ndarray:
+    """
+    ``heat_balance_kernel`` compiled by numba, one pass over the elements.
+    ``solar_geometry`` caches are not used, solar geometry is computed exactly.
+    The first call imports numba and compiles the kernel.
+
+    For float32 batches only storage is float32: numba types the Python float constants of
+    the kernel as float64, so every element is computed in float64 and rounded on store.
+    """
+    arrays = kernel_arrays(batch)
+    current = np.empty(len(arrays[0]), dtype=batch.dtype)
+    _compile_heat_balance_kernel()(*arrays, SolarHeatIntensityCoefficients, current)
+    return current.reshape(batch.shape)
+
+
+if importlib.util.find_spec("numba") is not None:
+    register_backend("numba", numba_backend)
@@ -1,7 +1,99 @@
+from typing import Any, Callable, Generic, Optional, TypeVar, overload
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class derived(Generic[T]):
+    """
+    Cached read-only property of a ``Base`` model.
+
+    ``depends_on`` names the attributes (inputs or other derived properties) the value
+    is computed from. The value is computed once and kept until one of those attributes,
+    directly or transitively, is set again on the instance.
+    """
+
+    def __init__(self, *depends_on: str) -> None:
+        self.depends_on = depends_on
+        self.name = ""
+        self.func: Optional[Callable[..., T]] = None
+
+    def __call__(self, func: Callable[..., R]) -> "derived[R]":
+        # a fresh instance, typed by the return type of the decorated function
+        prop: derived[R] = derived(*self.depends_on)
+        prop.func = func
+        prop.__doc__ = func.__doc__
+        return prop
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "derived[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T: ...
+
+    def __get__(self, instance: Optional[object], owner: Optional[type] = None) -> "T | derived[T]":
+        if instance is None:
+            return self
+        cache = instance.__dict__.setdefault("_cache", {})
+        try:
+            value: T = cache[self.name]
+        except KeyError:
+            assert self.func is not None
+            value = cache[self.name] = self.func(instance)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        raise AttributeError(f"derived property '{self.name}' of '{type(instance).__name__}' has no setter")
+
+
 class Base:
     name: str
 
     unit_mapping: dict[str, str]
 
+    # attribute name -> derived properties to invalidate when it is set
+    _dependents: dict[str, frozenset[str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        graph: dict[str, tuple[str, ...]] = {}
+        for key in {key for klass in cls.__mro__ for key in vars(klass)}:
+            for klass in cls.__mro__:
+                if key in vars(klass):
+                    if isinstance(vars(klass)[key], derived):
+                        graph[key] = vars(klass)[key].depends_on
+                    break
+
+        dependents: dict[str, set[str]] = {}
+        for key, depends_on in graph.items():
+            for dependency in depends_on:
+                dependents.setdefault(dependency, set()).add(key)
+
+        def _collect(key: str, seen: set[str]) -> set[str]:
+            for dependent in dependents.get(key, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    _collect(dependent, seen)
+            return seen
+
+        cls._dependents = {key: frozenset(_collect(key, set())) for key in dependents}
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        super().__setattr__(key, value)
+        cache = self.__dict__.get("_cache")
+        if cache:
+            for dependent in self._dependents.get(key, ()):
+                cache.pop(dependent, None)
+
+    def invalidate(self) -> None:
+        """
+        Drop every cached derived value, e.g. after an input array was modified in place.
+        """
+        self.__dict__.pop("_cache", None)
+
     def __repr__(self) -> str:
         return str(self.name)
@@ -0,0 +1,127 @@
+import csv
+import functools
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.models.conductor import ConductorSpec
+
+# Bundled conductor data, SI units as in ``ConductorSpec.unit_mapping``
+CatalogPath: Path = Path(__file__).parent.parent / "data" / "conductors.csv"
+
+# Text columns of the catalog, every other column is float64
+TextColumns: tuple[str, ...] = ("name", "code_word", "family")
+
+# ``ConductorBatch`` input fed by each catalog column
+BatchInputs: dict[str, str] = {
+    "diameter": "conductor_outside_diameter",
+    "low_temperature": "conductor_low_temperature",
+    "high_temperature": "conductor_high_temperature",
+    "ac_resistance_low": "conductor_ac_resistance_low",
+    "ac_resistance_high": "conductor_ac_resistance_high",
+    "heat_capacity": "conductor_heat_capacity",
+}
+
+
+class ConductorCatalog:
+    """
+    Columnar table of conductor types, one NumPy array per column.
+
+    Rows are found in O(1) by unique ``name`` (e.g. "Drake/ACSR") or by ``code_word``
+    (e.g. "Drake") plus ``family`` when the code word is used by several families.
+    Range queries on ``kcmil`` and ``diameter`` binary search presorted orders.
+
+    The bundled ACSR resistances, except Drake, are approximate: they are the AAC values of
+    the same aluminium area, ignoring the small contribution of the steel core. Use
+    manufacturer datasheets, e.g. through ``from_csv``, where exact ratings matter.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]) -> None:
+        self.columns = columns
+        self._names = {name: row for row, name in enumerate(columns["name"].tolist())}
+        self._code_words: dict[str, list[int]] = {}
+        for row, code_word in enumerate(columns["code_word"].tolist()):
+            self._code_words.setdefault(code_word.lower(), []).append(row)
+        self._orders = {key: np.argsort(columns[key], kind="stable") for key in ("kcmil", "diameter")}
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path]) -> "ConductorCatalog":
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            values = list(zip(*reader))
+        return cls(
+            {
+                key: np.array(column) if key in TextColumns else np.array(column, dtype=np.float64)
+                for key, column in zip(header, values)
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns["name"])
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._names or key.lower() in self._code_words
+
+    def index(self, key: str, family: Optional[str] = None) -> int:
+        """
+        Row of a conductor by name, or by code word and optionally family
+        """
+        if key in self._names:
+            return self._names[key]
+
+        rows = self._code_words.get(key.lower(), [])
+        if family is not None:
+            rows = [row for row in rows if self.columns["family"][row] == family]
+        if len(rows) == 1:
+            return rows[0]
+        if not rows:
+            raise KeyError(f"Unknown conductor '{key}'" + (f" in family '{family}'" if family else ""))
+        families = sorted(self.columns["family"][rows].tolist())
+        raise KeyError(f"Conductor '{key}' exists in families {families}, pass family")
+
+    def spec(self, key: str, family: Optional[str] = None) -> ConductorSpec:
+        """
+        ``ConductorSpec`` of a single conductor
+        """
+        row = self.index(key, family)
+        return ConductorSpec(**{column: values[row].item() for column, values in self.columns.items()})
+
+    def select(
+        self,
+        family: Optional[str] = None,
+        kcmil: Optional[tuple[float, float]] = None,
+        diameter: Optional[tuple[float, float]] = None,
+    ) -> np.ndarray:
+        """
+        Rows, in catalog order, of a family and/or inside inclusive kcmil and diameter ranges
+        """
+        mask = np.ones(len(self), dtype=bool) if family is None else self.columns["family"] == family
+        for key, bounds in (("kcmil", kcmil), ("diameter", diameter)):
+            if bounds is None:
+                continue
+            order = self._orders[key]
+            values = self.columns[key][order]
+            start, stop = np.searchsorted(values, bounds[0], "left"), np.searchsorted(values, bounds[1], "right")
+            inside = np.zeros(len(self), dtype=bool)
+            inside[order[start:stop]] = True
+            mask &= inside
+        return np.flatnonzero(mask)
+
+    def batch_inputs(self, rows: npt.ArrayLike) -> dict[str, np.ndarray]:
+        """
+        ``ConductorBatch`` conductor inputs of the given rows, e.g.
+        ``ConductorBatch(**catalog.batch_inputs(rows), wind_speed=...)``
+        """
+        rows = np.asarray(rows)
+        return {batch_input: self.columns[column][rows] for column, batch_input in BatchInputs.items()}
+
+
+@functools.cache
+def conductor_catalog() -> ConductorCatalog:
+    """
+    The bundled catalog, read on first use
+    """
+    return ConductorCatalog.from_csv(CatalogPath)
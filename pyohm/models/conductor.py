@@ -1,36 +1,54 @@
 import math
 from datetime import datetime
 from math import acos, asin, cos, degrees, radians, sin, tan
+from typing import NamedTuple, Optional
 
 import pyohm.units as units
-from pyohm.models.base import Base
-
-# Polynomial coefficients for solar heat intensity as a function of
-# solar altitude corresponding to clear atmosphere
-PolynomialCoefficientsOfClearAtmosphere: dict[str, float] = {
-    "A": -42.2391,
-    "B": 63.8044,
-    "C": -1.9220,
-    "D": 3.46921e-2,
-    "E": -3.61118e-4,
-    "F": 1.94318e-6,
-    "G": -4.07608e-9,
-}
-
-# Polynomial coefficients for solar heat intensity as a function of
-# solar altitude corresponding to industrial atmosphere
-PolynomialCoefficientsOfIndustrialAtmosphere: dict[str, float] = {
-    "A": 53.1821,
-    "B": 14.2110,
-    "C": 6.6138e-1,
-    "D": -3.1658e-2,
-    "E": 5.4654e-4,
-    "F": -4.3446e-6,
-    "G": 1.3236e-8,
-}
-
-
-class DrakeConductorSpec(Base):
+from pyohm.models.base import Base, derived
+from pyohm.models.solar import (
+    PolynomialCoefficientsOfClearAtmosphere,
+    PolynomialCoefficientsOfIndustrialAtmosphere,
+    SolarGeometryCache,
+)
+
+
+class ConductorSpec(Base):
+    """
+    Physical data of a conductor type, see ``pyohm.models.catalog`` for the bundled types.
+    """
+
+    name: str
+
+    kcmil: float
+
+    diameter: float
+
+    low_temperature: float
+
+    high_temperature: float
+
+    ac_resistance_low: float
+
+    ac_resistance_high: float
+
+    heat_capacity: float
+
+    unit_mapping = {
+        "kcmil": units.Kciml,
+        "diameter": units.Meter,
+        "low_temperature": units.DegreeC,
+        "high_temperature": units.DegreeC,
+        "ac_resistance_low": units.OhmPerMeter,
+        "ac_resistance_high": units.OhmPerMeter,
+        "heat_capacity": units.JoulePerMeterDegreeC,
+    }
+
+    def __init__(self, **attributes: float | str) -> None:
+        for key, value in attributes.items():
+            setattr(self, key, value)
+
+
+class DrakeConductorSpec(ConductorSpec):
     # Ref: https://assets.southwire.com/ImConvServlet/imconv/\
     #   6e40b948ad8bbb2c69490138659678cbf373c912/origin?hybrisId=otmmHybrisPRD&assetDescr=ACSR-Dec-2020
     name: str = "Drake"
@@ -48,14 +66,8 @@ class DrakeConductorSpec(Base):
 
     ac_resistance_high: float = 8.688e-5
 
-    unit_mapping = {
-        "kcmil": units.Kciml,
-        "diameter": units.Meter,
-        "low_temperature": units.DegreeC,
-        "high_temperature": units.DegreeC,
-        "ac_resistance_low": units.OhmPerMeter,
-        "ac_resistance_high": units.OhmPerMeter,
-    }
+    # aluminum 1.116 kg/m * 955 J/(kg*degreeC) + steel 0.5119 kg/m * 476 J/(kg*degreeC)
+    heat_capacity: float = 1310
 
 
 class Weather(Base):
@@ -96,6 +108,8 @@ class Conductor(Base):
 
     conductor_ac_resistance_high: float
 
+    conductor_heat_capacity: float
+
     azimuth_of_conductor: float
 
     latitude: float
@@ -106,60 +120,56 @@ class Conductor(Base):
 
     elevation: float
 
-    def __init__(self) -> None: ...
+    # Optional precomputed solar altitude and azimuth, shared by every instance when set on the class
+    solar_geometry: Optional[SolarGeometryCache] = None
 
-    def use_default(self) -> None:
+    def __init__(self, state: Optional["ConductorState"] = None) -> None:
+        if state is not None:
+            self.use_state(state)
+
+    def use_state(self, state: "ConductorState") -> None:
         """
-        Use default values from Drake ASCR for conductor attributes.
+        Use the input values of a ``ConductorState`` for conductor attributes.
         """
-        drake = DrakeConductorSpec()
-        self.conductor_outside_diameter = drake.diameter
-
-        self.conductor_low_temperature = drake.low_temperature
-        self.conductor_high_temperature = drake.high_temperature
-        self.conductor_ac_resistance_low = drake.ac_resistance_low
-        self.conductor_ac_resistance_high = drake.ac_resistance_high
-
-        self.max_allowable_conductor_temperature = 100.0
-
-        self.aluminum_strand_layers_average_temperature = self.max_allowable_conductor_temperature
-
-        self.conductor_surface_temperature = 100.0
-
-        self.latitude = 30.0
+        self.__dict__.update(zip(state._fields, state))
+        self.invalidate()
 
-        self.elevation = 0.0
-
-        self.clear_atmosphere = True
-
-        self.ambient_temperature = 40.0
-
-        self.wind_speed = 0.61
-
-        self.wind_direction = 90.0
-
-        self.date = datetime(year=2023, month=6, day=10, hour=11)
-
-        self.azimuth_of_conductor = 90.0
-
-        self.emissivity = 0.8
+    def use_spec(self, spec: ConductorSpec) -> None:
+        """
+        Use the physical data of a conductor type for conductor attributes.
+        """
+        self.conductor_outside_diameter = spec.diameter
+        self.conductor_low_temperature = spec.low_temperature
+        self.conductor_high_temperature = spec.high_temperature
+        self.conductor_ac_resistance_low = spec.ac_resistance_low
+        self.conductor_ac_resistance_high = spec.ac_resistance_high
+        self.conductor_heat_capacity = spec.heat_capacity
 
-        self.solar_absorption = 0.8
+    def use_default(self) -> None:
+        """
+        Use default values from Drake ASCR for conductor attributes.
+        """
+        self.use_state(DefaultConductorState)
 
-    @property
+    @derived("date")
     def number_of_day(self) -> int:
-        start_date = datetime(year=self.date.year, month=1, day=1)
-        delta = self.date.replace(hour=0, minute=0, second=0, microsecond=0) - start_date
-        return delta.days + 1
+        return self.date.timetuple().tm_yday
 
-    @property
+    @derived("date")
+    def hour(self) -> float:
+        """
+        Local solar time of day in fractional hours
+        """
+        return self.date.hour + self.date.minute / 60 + (self.date.second + self.date.microsecond / 1e6) / 3600
+
+    @derived("max_allowable_conductor_temperature", "ambient_temperature")
     def t_film(self) -> float:
         """
         T_film, Average temperature of the boundary layer
         """
         return (self.max_allowable_conductor_temperature + self.ambient_temperature) / 2
 
-    @property
+    @derived("elevation", "t_film")
     def air_density(self) -> float:
         """
         ρf, Density of air
@@ -171,7 +181,7 @@ class Conductor(Base):
     def p_f(self) -> float:
         return self.air_density
 
-    @property
+    @derived("t_film")
     def air_viscosity(self) -> float:
         """
         µf, Absolute (dynamic) viscosity of air
@@ -182,7 +192,7 @@ class Conductor(Base):
     def u_f(self) -> float:
         return self.air_viscosity
 
-    @property
+    @derived("t_film")
     def air_thermal_conductivity(self) -> float:
         """
         kf, Thermal conductivity of air
@@ -193,7 +203,7 @@ class Conductor(Base):
     def k_f(self) -> float:
         return self.air_thermal_conductivity
 
-    @property
+    @derived("wind_direction")
     def wind_direction_factor(self) -> float:
         """
         K_angle, Wind direction factor.
@@ -209,7 +219,7 @@ class Conductor(Base):
     def k_angle(self) -> float:
         return self.wind_direction_factor
 
-    @property
+    @derived("conductor_outside_diameter", "emissivity", "conductor_surface_temperature", "ambient_temperature")
     def radiated_heat_loss(self) -> float:
         """
         q_r, Radiated heat loss
@@ -225,7 +235,7 @@ class Conductor(Base):
     def q_r(self) -> float:
         return self.radiated_heat_loss
 
-    @property
+    @derived("number_of_day")
     def solar_declination(self) -> float:
         """
         δ, The solar declination (the angular distance of the sun from the Earth’s equator), δ, in degrees
@@ -233,18 +243,21 @@ class Conductor(Base):
         """
         return 23.45 * math.sin(math.radians(((284 + self.number_of_day) / 365) * 360))
 
-    @property
+    @derived("hour")
     def hour_angle(self) -> float:
         """
         "ω, Hour angle"
         """
-        return (self.date.hour - 12) * 15
+        return (self.hour - 12) * 15
 
-    @property
+    @derived("hour_angle", "latitude", "solar_declination", "number_of_day", "hour", "solar_geometry")
     def solar_azimuth(self) -> float:
         """
         Z_c, Solar azimuth
         """
+        if self.solar_geometry is not None:
+            return self.solar_geometry.get(self.latitude, self.number_of_day, self.hour)[1]
+
         X = sin(radians(self.hour_angle)) / (
             sin(radians(self.latitude)) * cos(radians(self.hour_angle))
             - cos(radians(self.latitude)) * tan(radians(self.solar_declination))
@@ -268,11 +281,14 @@ class Conductor(Base):
     def Z_c(self) -> float:
         return self.solar_azimuth
 
-    @property
+    @derived("latitude", "solar_declination", "hour_angle", "number_of_day", "hour", "solar_geometry")
     def solar_altitude(self) -> float:
         """
         Hc, Solar altitude
         """
+        if self.solar_geometry is not None:
+            return self.solar_geometry.get(self.latitude, self.number_of_day, self.hour)[0]
+
         return degrees(
             asin(
                 cos(radians(self.latitude)) * cos(radians(self.solar_declination)) * cos(radians(self.hour_angle))
@@ -284,7 +300,7 @@ class Conductor(Base):
     def H_c(self) -> float:
         return self.solar_altitude
 
-    @property
+    @derived("clear_atmosphere", "solar_altitude")
     def total_solar_and_sky_radiated_heat_intensity_at_sea_level(self) -> float:
         """
         Qs, Total solar and sky radiated heat intensity at sea level
@@ -295,15 +311,10 @@ class Conductor(Base):
             else PolynomialCoefficientsOfIndustrialAtmosphere
         )
 
-        Qs = (
-            coefficient_table["A"]
-            + coefficient_table["B"] * self.solar_altitude
-            + coefficient_table["C"] * self.solar_altitude**2
-            + coefficient_table["D"] * self.solar_altitude**3
-            + coefficient_table["E"] * self.solar_altitude**4
-            + coefficient_table["F"] * self.solar_altitude**5
-            + coefficient_table["G"] * self.solar_altitude**6
-        )
+        H_c = self.solar_altitude
+        Qs = coefficient_table["G"]
+        for coefficient in "FEDCBA":
+            Qs = Qs * H_c + coefficient_table[coefficient]
 
         return Qs
 
@@ -311,14 +322,17 @@ class Conductor(Base):
     def Q_s(self) -> float:
         return self.total_solar_and_sky_radiated_heat_intensity_at_sea_level
 
-    @property
+    @derived("elevation")
     def total_solar_and_sky_radiated_heat_intensity_factor(self) -> float:
         """
         K_solar,
         """
-        return 1 + 1.148e-4 * self.elevation + (-1.108e8 * self.elevation**2)
+        return 1 + 1.148e-4 * self.elevation + (-1.108e-8 * self.elevation**2)
 
-    @property
+    @derived(
+        "total_solar_and_sky_radiated_heat_intensity_factor",
+        "total_solar_and_sky_radiated_heat_intensity_at_sea_level",
+    )
     def total_solar_and_sky_radiated_heat_intensity(self) -> float:
         """
         Q_se, Total solar and sky radiated heat intensity corrected for elevation
@@ -328,7 +342,13 @@ class Conductor(Base):
             * self.total_solar_and_sky_radiated_heat_intensity_at_sea_level
         )
 
-    @property
+    @derived(
+        "solar_altitude",
+        "azimuth_of_conductor",
+        "solar_absorption",
+        "total_solar_and_sky_radiated_heat_intensity",
+        "conductor_outside_diameter",
+    )
     def solar_heat_gain(self) -> float:
         """
         q_s, Solar heat gain
@@ -347,7 +367,7 @@ class Conductor(Base):
     def q_s(self) -> float:
         return self.solar_heat_gain
 
-    @property
+    @derived("conductor_outside_diameter", "air_density", "wind_speed", "air_viscosity")
     def reynolds_number(self) -> float:
         """
         N_Re, The Reynolds number
@@ -358,7 +378,7 @@ class Conductor(Base):
     def N_Re(self) -> float:
         return self.reynolds_number
 
-    @property
+    @derived("air_density", "conductor_outside_diameter", "conductor_surface_temperature", "ambient_temperature")
     def natural_convection_heat_loss(self) -> float:
         """
         q_cn
@@ -374,7 +394,13 @@ class Conductor(Base):
     def q_cn(self) -> float:
         return self.natural_convection_heat_loss
 
-    @property
+    @derived(
+        "wind_direction_factor",
+        "reynolds_number",
+        "air_thermal_conductivity",
+        "conductor_surface_temperature",
+        "ambient_temperature",
+    )
     def forced_convection_heat_loss(self) -> float:
         """
         q_c
@@ -400,7 +426,13 @@ class Conductor(Base):
     def q_c(self) -> float:
         return self.forced_convection_heat_loss
 
-    @property
+    @derived(
+        "conductor_ac_resistance_high",
+        "conductor_ac_resistance_low",
+        "conductor_high_temperature",
+        "conductor_low_temperature",
+        "conductor_surface_temperature",
+    )
     def average_resistance(self) -> float:
         return (
             (self.conductor_ac_resistance_high - self.conductor_ac_resistance_low)
@@ -411,7 +443,7 @@ class Conductor(Base):
     def R_avg(self) -> float:
         return self.average_resistance
 
-    @property
+    @derived("forced_convection_heat_loss", "radiated_heat_loss", "solar_heat_gain", "average_resistance")
     def conductor_current(self) -> float:
         return math.sqrt(
             (self.forced_convection_heat_loss + self.radiated_heat_loss - self.solar_heat_gain)
@@ -421,3 +453,54 @@ class Conductor(Base):
     @property
     def I(self) -> float:
         return self.conductor_current
+
+
+class ConductorState(NamedTuple):
+    """
+    Immutable, compact inputs of a ``Conductor``.
+
+    Build it from keyword arguments, from a dict with ``ConductorState(**row)`` or from a
+    tuple row in field order with ``ConductorState._make(row)``. Omitted fields share the
+    Drake ASCR defaults of ``Conductor.use_default``.
+    """
+
+    wind_speed: float = 0.61
+
+    wind_direction: float = 90.0
+
+    emissivity: float = 0.8
+
+    solar_absorption: float = 0.8
+
+    ambient_temperature: float = 40.0
+
+    conductor_surface_temperature: float = 100.0
+
+    aluminum_strand_layers_average_temperature: float = 100.0
+
+    max_allowable_conductor_temperature: float = 100.0
+
+    conductor_outside_diameter: float = DrakeConductorSpec.diameter
+
+    conductor_low_temperature: float = DrakeConductorSpec.low_temperature
+
+    conductor_high_temperature: float = DrakeConductorSpec.high_temperature
+
+    conductor_ac_resistance_low: float = DrakeConductorSpec.ac_resistance_low
+
+    conductor_ac_resistance_high: float = DrakeConductorSpec.ac_resistance_high
+
+    conductor_heat_capacity: float = DrakeConductorSpec.heat_capacity
+
+    azimuth_of_conductor: float = 90.0
+
+    latitude: float = 30.0
+
+    clear_atmosphere: bool = True
+
+    date: datetime = datetime(year=2023, month=6, day=10, hour=11)
+
+    elevation: float = 0.0
+
+
+DefaultConductorState = ConductorState()
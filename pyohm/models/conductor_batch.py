@@ -0,0 +1,263 @@
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.models import backends, solar
+from pyohm.models.base import derived
+from pyohm.models.conductor import Conductor, ConductorState
+
+# Input attributes of ``Conductor`` which may be given as arrays
+ConductorInputs: tuple[str, ...] = ConductorState._fields
+
+# Bound on the relative error of the float32 conductor current against float64,
+# checked over the Drake reference case and randomized weather in the tests
+Float32RelativeError: float = 1e-5
+
+
+class ConductorBatch(Conductor):
+    """
+    Vectorized ``Conductor``, every input is a NumPy array (or scalar) and every
+    heat term is evaluated element-wise with broadcasting.
+
+    Inputs which are not given fall back to the Drake defaults of ``Conductor.use_default``.
+
+    ``dtype`` is the floating point type of the inputs and of every computed array, setting it
+    later recasts the inputs. ``np.float32`` halves memory and bandwidth on fleet-scale runs,
+    the conductor current then stays within ``Float32RelativeError`` of the float64 result.
+    """
+
+    name: str = "ConductorBatch"
+
+    dtype: np.dtype[np.floating[Any]] = np.dtype(np.float64)
+
+    wind_speed: npt.NDArray[np.floating[Any]]
+
+    wind_direction: npt.NDArray[np.floating[Any]]
+
+    emissivity: npt.NDArray[np.floating[Any]]
+
+    solar_absorption: npt.NDArray[np.floating[Any]]
+
+    ambient_temperature: npt.NDArray[np.floating[Any]]
+
+    conductor_surface_temperature: npt.NDArray[np.floating[Any]]
+
+    aluminum_strand_layers_average_temperature: npt.NDArray[np.floating[Any]]
+
+    max_allowable_conductor_temperature: npt.NDArray[np.floating[Any]]
+
+    conductor_outside_diameter: npt.NDArray[np.floating[Any]]
+
+    conductor_low_temperature: npt.NDArray[np.floating[Any]]
+
+    conductor_high_temperature: npt.NDArray[np.floating[Any]]
+
+    conductor_ac_resistance_low: npt.NDArray[np.floating[Any]]
+
+    conductor_ac_resistance_high: npt.NDArray[np.floating[Any]]
+
+    conductor_heat_capacity: npt.NDArray[np.floating[Any]]
+
+    azimuth_of_conductor: npt.NDArray[np.floating[Any]]
+
+    latitude: npt.NDArray[np.floating[Any]]
+
+    clear_atmosphere: npt.NDArray[np.bool_]
+
+    date: npt.NDArray[np.datetime64]
+
+    elevation: npt.NDArray[np.floating[Any]]
+
+    def __init__(self, dtype: npt.DTypeLike = np.float64, **inputs: Any) -> None:
+        unknown = set(inputs) - set(ConductorInputs)
+        if unknown:
+            raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+
+        self._set_dtype(dtype)
+        self.use_default()
+
+        for key, value in inputs.items():
+            setattr(self, key, value)
+
+    def update(self, **inputs: Any) -> "ConductorBatch":
+        """
+        Set new values of some inputs, e.g. ``batch.update(wind_speed=...)``.
+
+        Intermediate arrays which do not depend on the updated inputs (solar gain, radiated
+        loss, air properties, ...) stay cached, so the next rating recomputes only the terms
+        downstream of the change.
+        """
+        unknown = set(inputs) - set(ConductorInputs)
+        if unknown:
+            raise TypeError(f"Unknown conductor inputs: {sorted(unknown)}")
+
+        for key, value in inputs.items():
+            setattr(self, key, value)
+        return self
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key == "dtype":
+            self._set_dtype(value)
+            return
+        if key == "date":
+            value = np.asarray(value, dtype="datetime64[s]")
+        elif key == "clear_atmosphere":
+            value = np.asarray(value, dtype=bool)
+        elif key in ConductorInputs:
+            value = np.asarray(value, dtype=self.dtype)
+        super().__setattr__(key, value)
+
+    def _set_dtype(self, dtype: npt.DTypeLike) -> None:
+        """
+        Recast the inputs already set to ``dtype`` and drop every value computed in the previous type
+        """
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.floating):
+            raise TypeError(f"dtype must be a floating point type, got {dtype}")
+        super().__setattr__("dtype", dtype)
+        for key in ConductorInputs:
+            if key in self.__dict__:
+                setattr(self, key, self.__dict__[key])
+        self.invalidate()
+
+    def use_state(self, state: ConductorState) -> None:
+        for key, value in zip(state._fields, state):
+            setattr(self, key, value)
+
+    @classmethod
+    def from_states(cls, states: Iterable[ConductorState]) -> "ConductorBatch":
+        """
+        One batch row per ``ConductorState``
+        """
+        columns = list(zip(*states))
+        if not columns:
+            raise ValueError("At least one conductor state is required")
+        return cls(**dict(zip(ConductorState._fields, columns)))
+
+    def rate(self, backend: Optional[str] = None) -> np.ndarray:
+        """
+        Conductor current of every element computed by a heat-balance kernel backend,
+        see ``pyohm.models.backends``. Uses NumPy unless another backend, e.g. "numba", is named.
+        """
+        return backends.get_backend(backend)(self)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        Broadcast shape of all inputs
+        """
+        return np.broadcast_shapes(*(np.shape(getattr(self, key)) for key in ConductorInputs))
+
+    @derived("date")
+    def number_of_day(self) -> np.ndarray:
+        return solar.day_of_year(self.date)
+
+    @derived("date")
+    def hour(self) -> np.ndarray:
+        """
+        Local solar time of day in fractional hours
+        """
+        return solar.hour_of_day(self.date).astype(self.dtype)
+
+    @derived("t_film")
+    def air_viscosity(self) -> np.ndarray:
+        """
+        µf, Absolute (dynamic) viscosity of air
+        """
+        return np.asarray((1.458e-6 * (self.t_film + 273) ** 1.5) / (self.t_film + 383.4))
+
+    @derived("wind_direction")
+    def wind_direction_factor(self) -> np.ndarray:
+        """
+        K_angle, Wind direction factor.
+        """
+        phi = np.radians(self.wind_direction)
+        return np.asarray(1.194 - np.cos(phi) + 0.194 * np.cos(2 * phi) + 0.368 * np.sin(2 * phi))
+
+    @derived("number_of_day")
+    def solar_declination(self) -> np.ndarray:
+        """
+        δ, The solar declination in degrees
+        """
+        return solar.solar_declination(self.number_of_day.astype(self.dtype))
+
+    @derived("hour")
+    def hour_angle(self) -> np.ndarray:
+        """
+        ω, Hour angle
+        """
+        return solar.hour_angle(self.hour)
+
+    @derived("hour_angle", "latitude", "solar_declination", "number_of_day", "hour", "solar_geometry")
+    def solar_azimuth(self) -> np.ndarray:
+        """
+        Z_c, Solar azimuth
+        """
+        if self.solar_geometry is not None:
+            return self.solar_geometry.lookup(self.latitude, self.number_of_day, self.hour)[1].astype(self.dtype)
+        return solar.solar_azimuth(self.latitude, self.solar_declination, self.hour_angle)
+
+    @derived("latitude", "solar_declination", "hour_angle", "number_of_day", "hour", "solar_geometry")
+    def solar_altitude(self) -> np.ndarray:
+        """
+        Hc, Solar altitude
+        """
+        if self.solar_geometry is not None:
+            return self.solar_geometry.lookup(self.latitude, self.number_of_day, self.hour)[0].astype(self.dtype)
+        return solar.solar_altitude(self.latitude, self.solar_declination, self.hour_angle)
+
+    @derived("clear_atmosphere", "solar_altitude")
+    def total_solar_and_sky_radiated_heat_intensity_at_sea_level(self) -> np.ndarray:
+        """
+        Qs, Total solar and sky radiated heat intensity at sea level
+        """
+        return solar.solar_heat_intensity(self.solar_altitude, self.clear_atmosphere)
+
+    @derived(
+        "solar_altitude",
+        "azimuth_of_conductor",
+        "solar_absorption",
+        "total_solar_and_sky_radiated_heat_intensity",
+        "conductor_outside_diameter",
+    )
+    def solar_heat_gain(self) -> np.ndarray:
+        """
+        q_s, Solar heat gain
+        """
+        H_c = self.solar_altitude
+        theta = np.arccos(np.cos(np.radians(H_c)) * np.cos(np.radians(H_c - self.azimuth_of_conductor)))
+        return np.asarray(
+            self.solar_absorption
+            * self.total_solar_and_sky_radiated_heat_intensity
+            * np.sin(theta)
+            * self.conductor_outside_diameter
+        )
+
+    @derived(
+        "wind_direction_factor",
+        "reynolds_number",
+        "air_thermal_conductivity",
+        "conductor_surface_temperature",
+        "ambient_temperature",
+    )
+    def forced_convection_heat_loss(self) -> np.ndarray:
+        """
+        q_c
+        """
+        N_Re = self.reynolds_number
+        q_c = (
+            self.wind_direction_factor
+            * self.air_thermal_conductivity
+            * (self.conductor_surface_temperature - self.ambient_temperature)
+        )
+        return np.asarray(np.maximum(q_c * (1.05 + 1.35 * N_Re**0.52), q_c * 0.754 * N_Re**0.6))
+
+    @derived("forced_convection_heat_loss", "radiated_heat_loss", "solar_heat_gain", "average_resistance")
+    def conductor_current(self) -> np.ndarray:
+        return np.asarray(
+            np.sqrt(
+                (self.forced_convection_heat_loss + self.radiated_heat_loss - self.solar_heat_gain)
+                / self.average_resistance
+            )
+        )
@@ -0,0 +1,290 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
+import numpy.typing as npt
+
+# Polynomial coefficients for solar heat intensity as a function of
+# solar altitude corresponding to clear atmosphere
+PolynomialCoefficientsOfClearAtmosphere: dict[str, float] = {
+    "A": -42.2391,
+    "B": 63.8044,
+    "C": -1.9220,
+    "D": 3.46921e-2,
+    "E": -3.61118e-4,
+    "F": 1.94318e-6,
+    "G": -4.07608e-9,
+}
+
+# Polynomial coefficients for solar heat intensity as a function of
+# solar altitude corresponding to industrial atmosphere
+PolynomialCoefficientsOfIndustrialAtmosphere: dict[str, float] = {
+    "A": 53.1821,
+    "B": 14.2110,
+    "C": 6.6138e-1,
+    "D": -3.1658e-2,
+    "E": 5.4654e-4,
+    "F": -4.3446e-6,
+    "G": 1.3236e-8,
+}
+
+# Both coefficient tables as one array, shape (2, 7), row 0 industrial and row 1 clear atmosphere
+# so a boolean clear_atmosphere mask selects its row, columns from A (constant term) to G
+SolarHeatIntensityCoefficients: np.ndarray = np.array(
+    [
+        list(PolynomialCoefficientsOfIndustrialAtmosphere.values()),
+        list(PolynomialCoefficientsOfClearAtmosphere.values()),
+    ]
+)
+
+# Number of days covered by a cached latitude row
+DaysPerYear: int = 366
+
+
+def day_of_year(date: npt.ArrayLike) -> np.ndarray:
+    """
+    Day of the year, 1 on January 1st, of ``datetime64`` timestamps
+    """
+    date = np.asarray(date, dtype="datetime64[s]")
+    days = date.astype("datetime64[D]")
+    return np.asarray((days - date.astype("datetime64[Y]").astype("datetime64[D]")).astype(np.int64) + 1)
+
+
+def hour_of_day(date: npt.ArrayLike) -> np.ndarray:
+    """
+    Time of day in fractional hours of ``datetime64`` timestamps, at the resolution of the timestamps
+    """
+    date = np.asarray(date)
+    if not np.issubdtype(date.dtype, np.datetime64):
+        date = date.astype("datetime64[s]")
+    return np.asarray((date - date.astype("datetime64[D]")) / np.timedelta64(1, "h"))
+
+
+def solar_declination(number_of_day: npt.ArrayLike) -> np.ndarray:
+    """
+    δ, The solar declination in degrees
+    """
+    return 23.45 * np.sin(np.radians(((284 + np.asarray(number_of_day)) / 365) * 360))
+
+
+def hour_angle(hour: npt.ArrayLike) -> np.ndarray:
+    """
+    ω, Hour angle in degrees
+    """
+    return (np.asarray(hour) - 12) * 15
+
+
+def solar_azimuth(latitude: npt.ArrayLike, declination: npt.ArrayLike, omega: npt.ArrayLike) -> np.ndarray:
+    """
+    Z_c, Solar azimuth in degrees
+    """
+    omega = np.asarray(omega)
+    latitude = np.radians(latitude)
+    X = np.sin(np.radians(omega)) / (
+        np.sin(latitude) * np.cos(np.radians(omega)) - np.cos(latitude) * np.tan(np.radians(declination))
+    )
+    C = np.where(omega < 0, np.where(X >= 0, 0, 180), np.where(X >= 0, 180, 360)).astype(X.dtype)
+    return np.asarray(C + np.degrees(np.arctan(X)))
+
+
+def solar_altitude(latitude: npt.ArrayLike, declination: npt.ArrayLike, omega: npt.ArrayLike) -> np.ndarray:
+    """
+    Hc, Solar altitude in degrees
+    """
+    latitude = np.radians(latitude)
+    declination = np.radians(declination)
+    sine = np.cos(latitude) * np.cos(declination) * np.cos(np.radians(omega)) + np.sin(latitude) * np.sin(declination)
+    return np.asarray(np.degrees(np.arcsin(sine)))
+
+
+def solar_heat_intensity(solar_altitude: npt.ArrayLike, clear_atmosphere: npt.ArrayLike) -> np.ndarray:
+    """
+    Qs, Total solar and sky radiated heat intensity at sea level (W/m^2)
+
+    The 6th order polynomial is evaluated in Horner form, ``clear_atmosphere`` picks the
+    coefficient table per element. The result keeps the floating point type of ``solar_altitude``.
+    """
+    solar_altitude = np.asarray(solar_altitude)
+    coefficients = SolarHeatIntensityCoefficients.astype(np.result_type(solar_altitude, np.float32), copy=False)
+    coefficients = coefficients[np.asarray(clear_atmosphere, dtype=np.intp)]
+    Qs = coefficients[..., 6]
+    for i in range(5, -1, -1):
+        Qs = Qs * solar_altitude + coefficients[..., i]
+    return Qs
+
+
+def _interpolate_geometry(
+    lower: tuple[npt.ArrayLike, npt.ArrayLike], upper: tuple[npt.ArrayLike, npt.ArrayLike], weight: npt.ArrayLike
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Linear blend of two (altitude, azimuth) pairs, the azimuth along the shorter arc so a
+    step across north (0 and 360 degrees) does not swing through south
+    """
+    lower_altitude, lower_azimuth = np.asarray(lower[0]), np.asarray(lower[1])
+    upper_altitude, upper_azimuth = np.asarray(upper[0]), np.asarray(upper[1])
+    turn = (upper_azimuth - lower_azimuth + 180) % 360 - 180
+    return lower_altitude + weight * (upper_altitude - lower_altitude), (lower_azimuth + weight * turn) % 360
+
+
+class SolarGeometryCache:
+    """
+    Solar altitude and azimuth precomputed on a (latitude, day of year, time of day) grid.
+
+    Latitudes are quantized to ``latitude_resolution`` degrees and times of day to
+    ``hour_resolution`` hours (e.g. 1 / 60 for minutes), every quantized latitude is computed
+    once for all days and times of the year the first time it is looked up.
+    Times between two grid times are interpolated linearly.
+    With ``interpolate`` the two neighbouring latitude rows are blended linearly instead
+    of snapping to the nearest one.
+
+    At most ``max_rows`` latitude rows are kept, the least recently used row is evicted first.
+    A single lookup needing more rows holds them all until it returns.
+
+    ``hits`` and ``misses`` both count looked up values, a miss being a value whose latitude
+    row had to be computed. Interpolated lookups read two rows and count twice.
+    """
+
+    def __init__(
+        self,
+        latitude_resolution: float = 0.01,
+        interpolate: bool = False,
+        hour_resolution: float = 1.0,
+        max_rows: int = 64,
+    ) -> None:
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1")
+        self.latitude_resolution = latitude_resolution
+        self.hour_resolution = hour_resolution
+        self.max_rows = max_rows
+        # times of day from 00:00 to 24:00 inclusive
+        self._hours = np.arange(round(24 / hour_resolution) + 1) * hour_resolution
+        self.interpolate = interpolate
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # quantized latitude -> row of the altitude and azimuth tables, least recently used first
+        self._index: OrderedDict[int, int] = OrderedDict()
+        self._free: list[int] = []
+        self._altitude = np.empty((0, DaysPerYear, len(self._hours)))
+        self._azimuth = np.empty((0, DaysPerYear, len(self._hours)))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def clear(self) -> None:
+        self._index.clear()
+        self._free.clear()
+        self._altitude = self._altitude[:0]
+        self._azimuth = self._azimuth[:0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evict(self, rows: int) -> None:
+        """
+        Evict least recently used latitude rows until at most ``rows`` are left
+        """
+        while len(self._index) > rows:
+            _, position = self._index.popitem(last=False)
+            self._free.append(position)
+            self.evictions += 1
+
+    def _add(self, keys: list[int], pinned: int = 0) -> None:
+        """
+        Compute the altitude and azimuth of every day and hour for new quantized latitudes.
+
+        The ``pinned`` most recently used rows belong to the current lookup and are never evicted.
+        """
+        self._evict(max(self.max_rows - len(keys), pinned))
+        reused, self._free = self._free[: len(keys)], self._free[len(keys) :]
+        allocated = len(self._index) + len(self._free) + len(reused)
+        needed = allocated + len(keys) - len(reused)
+        if needed > len(self._altitude):
+            capacity = min(max(2 * len(self._altitude), needed, 16), max(self.max_rows, needed))
+            for name in ("_altitude", "_azimuth"):
+                table = np.empty((capacity, DaysPerYear, len(self._hours)))
+                table[:allocated] = getattr(self, name)[:allocated]
+                setattr(self, name, table)
+        positions = reused + list(range(allocated, needed))
+
+        latitude = np.asarray(keys, dtype=np.float64)[:, None, None] * self.latitude_resolution
+        declination = solar_declination(np.arange(1, DaysPerYear + 1))[None, :, None]
+        omega = hour_angle(self._hours)[None, None, :]
+        self._altitude[positions] = solar_altitude(latitude, declination, omega)
+        self._azimuth[positions] = solar_azimuth(latitude, declination, omega)
+        for position, key in zip(positions, keys):
+            self._index[key] = position
+
+    def _gather(self, keys: np.ndarray, number_of_day: np.ndarray, hour: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        unique, inverse = np.unique(keys, return_inverse=True)
+        cached = np.array([key in self._index for key in unique.tolist()], dtype=bool)
+        for key in unique[cached].tolist():
+            self._index.move_to_end(key)
+        counts = np.bincount(inverse.reshape(-1), minlength=len(unique))
+        self.hits += int(counts[cached].sum())
+        self.misses += int(counts[~cached].sum())
+        if not cached.all():
+            self._add(unique[~cached].tolist(), pinned=int(cached.sum()))
+
+        rows = np.array([self._index[key] for key in unique.tolist()], dtype=np.int64)[inverse.reshape(keys.shape)]
+        day = number_of_day - 1
+        position = hour / self.hour_resolution
+        column = np.clip(np.floor(position).astype(np.int64), 0, len(self._hours) - 1)
+        next_column = np.minimum(column + 1, len(self._hours) - 1)
+        result = _interpolate_geometry(
+            (self._altitude[rows, day, column], self._azimuth[rows, day, column]),
+            (self._altitude[rows, day, next_column], self._azimuth[rows, day, next_column]),
+            position - column,
+        )
+        self._evict(self.max_rows)
+        return result
+
+    def lookup(
+        self, latitude: npt.ArrayLike, number_of_day: npt.ArrayLike, hour: npt.ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Solar altitude and azimuth in degrees, inputs broadcast against each other.
+        """
+        latitude, number_of_day, hour = np.broadcast_arrays(
+            np.asarray(latitude, dtype=np.float64), np.asarray(number_of_day), np.asarray(hour)
+        )
+        position = latitude / self.latitude_resolution
+
+        if not self.interpolate:
+            return self._gather(np.round(position).astype(np.int64), number_of_day, hour)
+
+        lower = np.floor(position)
+        weight = position - lower
+        return _interpolate_geometry(
+            self._gather(lower.astype(np.int64), number_of_day, hour),
+            self._gather(lower.astype(np.int64) + 1, number_of_day, hour),
+            weight,
+        )
+
+    def get(self, latitude: float, number_of_day: int, hour: float) -> tuple[float, float]:
+        """
+        Scalar ``lookup`` without array overhead, used by ``Conductor``.
+        """
+        if self.interpolate:
+            altitude, azimuth = self.lookup(latitude, number_of_day, hour)
+            return float(altitude), float(azimuth)
+
+        key = round(latitude / self.latitude_resolution)
+        if key in self._index:
+            self.hits += 1
+            self._index.move_to_end(key)
+        else:
+            self.misses += 1
+            self._add([key])
+        row, day = self._index[key], number_of_day - 1
+        position = hour / self.hour_resolution
+        column = min(max(math.floor(position), 0), len(self._hours) - 1)
+        next_column = min(column + 1, len(self._hours) - 1)
+        weight = position - column
+        altitude = self._altitude[row, day, column].item()
+        azimuth = self._azimuth[row, day, column].item()
+        if weight:
+            next_altitude = self._altitude[row, day, next_column].item()
+            turn = (self._azimuth[row, day, next_column].item() - azimuth + 180) % 360 - 180
+            altitude, azimuth = altitude + weight * (next_altitude - altitude), (azimuth + weight * turn) % 360
+        return altitude, azimuth
@@ -0,0 +1,9 @@
+import numpy as np
+
+
+def ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """
+    Concatenation of ``arange(start, stop)`` of every pair, e.g. the slots of a set of CSR rows
+    """
+    lengths = stops - starts
+    return np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
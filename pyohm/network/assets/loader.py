@@ -0,0 +1,204 @@
+import contextlib
+import csv
+import gc
+import json
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from pyohm.network.assets.table import AssetTable, AssetTypeCodes
+
+PathLike = Union[str, Path]
+
+# Code of every valid ``asset_type`` value
+AssetTypeValues: dict[str, int] = {asset_type.value: code for asset_type, code in AssetTypeCodes.items()}
+
+# Invalid rows listed in the message of an ``AssetValidationError``
+MaxReportedRows: int = 20
+
+
+class AssetValidationError(ValueError):
+    """
+    Invalid rows of a bulk asset load, ``errors`` maps every invalid row (0-based line of the file,
+    header excluded) to its problems.
+    """
+
+    def __init__(self, errors: dict[int, list[str]]) -> None:
+        self.errors = errors
+        rows = sorted(errors)
+        lines = [f"row {row}: {'; '.join(errors[row])}" for row in rows[:MaxReportedRows]]
+        if len(rows) > MaxReportedRows:
+            lines.append(f"... and {len(rows) - MaxReportedRows} more rows")
+        super().__init__(f"{len(rows)} invalid asset rows\n" + "\n".join(lines))
+
+
+@contextlib.contextmanager
+def _paused_gc() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector, which otherwise rescans the millions of new row
+    objects of a bulk load many times over
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _floats(values: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ``values`` as float64, NaN for None and empty strings, and the mask of values which are not numbers
+    """
+    values = [np.nan if value is None or value == "" else value for value in values]
+    try:
+        return np.array(values, dtype=np.float64), np.zeros(len(values), dtype=bool)
+    except (TypeError, ValueError):
+        pass
+
+    result = np.full(len(values), np.nan)
+    invalid = np.zeros(len(values), dtype=bool)
+    for row, value in enumerate(values):
+        try:
+            result[row] = float(value)
+        except (TypeError, ValueError):
+            invalid[row] = True
+    return result, invalid
+
+
+def assets_from_columns(
+    ids: list[Any],
+    names: list[Any],
+    asset_types: list[Any],
+    x: list[Any],
+    y: list[Any],
+    errors: Optional[dict[int, list[str]]] = None,
+    rows: Optional[Sequence[int]] = None,
+) -> AssetTable:
+    """
+    Validate whole columns and build an ``AssetTable``, ``Model`` instances are only built
+    on demand by ``AssetTable.model``.
+
+    Coordinates are optional, missing when both ``x`` and ``y`` are None or empty. Every problem
+    (missing or empty id or name, unknown ``asset_type``, non-finite or half coordinates, duplicate
+    id) is collected, together with ``errors`` found while parsing, into one ``AssetValidationError``.
+    ``rows`` are the file rows of the column entries used in its report, by default their positions.
+    """
+    errors = {row: list(messages) for row, messages in (errors or {}).items()}
+    row_numbers = np.arange(len(ids)) if rows is None else np.asarray(rows, dtype=np.int64)
+
+    def report(positions: np.ndarray, message: str) -> None:
+        for row in row_numbers[positions].tolist():
+            errors.setdefault(row, []).append(message)
+
+    ids_column = np.array(["" if value is None else str(value) for value in ids], dtype=np.str_)
+    report(np.flatnonzero(ids_column == ""), "missing id")
+    report(np.flatnonzero(np.array([value is None or value == "" for value in names], dtype=bool)), "missing name")
+
+    values, inverse = np.unique(np.array([str(value) for value in asset_types], dtype=np.str_), return_inverse=True)
+    value_codes = np.array([AssetTypeValues.get(value, -1) for value in values.tolist()], dtype=np.int64)
+    codes = value_codes[inverse.reshape(-1)] if len(values) else np.zeros(0, dtype=np.int64)
+    report(np.flatnonzero(codes < 0), f"asset_type is not one of {list(AssetTypeValues)}")
+
+    coordinates = np.empty((len(ids_column), 2))
+    coordinates[:, 0], invalid_x = _floats(x)
+    coordinates[:, 1], invalid_y = _floats(y)
+    missing = np.isnan(coordinates).all(axis=1) & ~invalid_x & ~invalid_y
+    invalid = ~missing & ~np.isfinite(coordinates).all(axis=1)
+    report(np.flatnonzero(invalid), "coordinates must be a pair of finite numbers")
+
+    order = np.argsort(ids_column, kind="stable")
+    duplicate = order[1:][ids_column[order][1:] == ids_column[order][:-1]]
+    report(duplicate[ids_column[duplicate] != ""], "duplicate id")
+
+    if errors:
+        raise AssetValidationError(errors)
+
+    return AssetTable(ids_column, [str(value) for value in names], codes, coordinates)
+
+
+def read_assets_jsonl(path: PathLike) -> AssetTable:
+    """
+    Read a JSON Lines file of ``Model`` fields, e.g.
+    ``{"id": "n1", "name": "Bus 1", "asset_type": "Node", "coordinates": [45.4, -75.7]}``.
+    Blank lines are skipped but still counted in the row numbers of errors.
+    """
+    errors: dict[int, list[str]] = {}
+    rows: list[int] = []
+    ids: list[Any] = []
+    names: list[Any] = []
+    asset_types: list[Any] = []
+    x: list[Any] = []
+    y: list[Any] = []
+    with open(path) as f, _paused_gc():
+        for row, line in enumerate(f):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                errors[row] = [f"invalid JSON: {e}"]
+                continue
+            if not isinstance(record, dict):
+                errors[row] = ["not a JSON object"]
+                continue
+
+            rows.append(row)
+            ids.append(record.get("id"))
+            names.append(record.get("name"))
+            asset_types.append(record.get("asset_type"))
+            coordinates = record.get("coordinates")
+            if coordinates is None:
+                x.append(None)
+                y.append(None)
+            elif isinstance(coordinates, list) and len(coordinates) == 2:
+                x.append(coordinates[0])
+                y.append(coordinates[1])
+            else:
+                x.append(np.nan)
+                y.append(np.nan)
+                errors.setdefault(row, []).append("coordinates must be a pair of finite numbers")
+
+        return assets_from_columns(ids, names, asset_types, x, y, errors, rows)
+
+
+def read_assets_csv(path: PathLike) -> AssetTable:
+    """
+    Read a CSV file with a header row of ``id``, ``name``, ``asset_type`` and optional ``x`` and ``y``
+    coordinate columns, empty for assets without coordinates.
+    """
+    with open(path, newline="") as f, _paused_gc():
+        reader = csv.reader(f)
+        header = next(reader)
+        lines = list(reader)
+
+        missing = {"id", "name", "asset_type"} - set(header)
+        if missing:
+            raise ValueError(f"{path} is missing columns {sorted(missing)}")
+
+        errors = {row: ["wrong number of columns"] for row, values in enumerate(lines) if len(values) != len(header)}
+        rows = [row for row in range(len(lines)) if row not in errors]
+        records = [lines[row] for row in rows] if errors else lines
+
+        columns = dict(zip(header, (list(values) for values in zip(*records)))) if records else {}
+        empty = [None] * len(records)
+        return assets_from_columns(
+            columns.get("id", []),
+            columns.get("name", []),
+            columns.get("asset_type", []),
+            columns.get("x", empty),
+            columns.get("y", empty),
+            errors,
+            rows,
+        )
+
+
+def read_assets(path: PathLike) -> AssetTable:
+    """
+    ``read_assets_jsonl`` for ``.jsonl`` files, ``read_assets_csv`` otherwise
+    """
+    if Path(path).suffix == ".jsonl":
+        return read_assets_jsonl(path)
+    return read_assets_csv(path)
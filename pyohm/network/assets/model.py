@@ -25,5 +25,5 @@ class AssetType(enum.Enum):
 class Model(BaseModel):
     id: str = Field(..., alias="id")
     name: str = Field(..., alias="name")
-    coordinates: Optional[Tuple[float, float]] = Field(..., alias="coordinates", default=None)
+    coordinates: Optional[Tuple[float, float]] = Field(default=None, alias="coordinates")
     asset_type: AssetType = Field(..., alias="asset_type")
@@ -0,0 +1,121 @@
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.network.assets.model import AssetType, Model
+
+# Asset types by code, the code of a type is its position in ``AssetType``
+AssetTypes: tuple[AssetType, ...] = tuple(AssetType)
+
+# Code of every asset type
+AssetTypeCodes: dict[AssetType, int] = {asset_type: code for code, asset_type in enumerate(AssetTypes)}
+
+
+class AssetTable:
+    """
+    Columnar table of network assets, one NumPy array per ``Model`` field.
+
+    ``asset_types`` holds small-integer codes (see ``AssetTypeCodes``) and ``coordinates``
+    a contiguous (N, 2) float64 array, NaN for assets without coordinates.
+    Rows are found in O(1) by unique ``id``, several rows at once by binary search in the
+    ids sorted on first use.
+    """
+
+    def __init__(
+        self,
+        ids: npt.ArrayLike,
+        names: npt.ArrayLike,
+        asset_types: npt.ArrayLike,
+        coordinates: Optional[npt.ArrayLike] = None,
+    ) -> None:
+        self.ids = np.asarray(ids, dtype=np.str_)
+        self.names = np.asarray(names, dtype=np.str_)
+        self.asset_types = np.asarray(asset_types, dtype=np.uint8)
+        if coordinates is None:
+            coordinates = np.full((len(self.ids), 2), np.nan)
+        self.coordinates = np.ascontiguousarray(coordinates, dtype=np.float64).reshape(-1, 2)
+
+        if not len(self.ids) == len(self.names) == len(self.asset_types) == len(self.coordinates):
+            raise ValueError("All columns must have the same length")
+        if np.any(self.asset_types >= len(AssetTypes)):
+            raise ValueError("Unknown asset type codes")
+
+        self._index = {asset_id: row for row, asset_id in enumerate(self.ids.tolist())}
+        if len(self._index) != len(self.ids):
+            raise ValueError("Asset ids must be unique")
+        # rows in id order and the ids in that order, see ``indices``
+        self._id_order = np.empty(0, dtype=np.int64)
+        self._sorted_ids: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_models(cls, models: Iterable[Model]) -> "AssetTable":
+        models = list(models)
+        return cls(
+            [model.id for model in models],
+            [model.name for model in models],
+            [AssetTypeCodes[model.asset_type] for model in models],
+            [model.coordinates if model.coordinates is not None else (np.nan, np.nan) for model in models],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, asset_id: str) -> bool:
+        return asset_id in self._index
+
+    def index(self, asset_id: str) -> int:
+        """
+        Row of an asset by id
+        """
+        try:
+            return self._index[asset_id]
+        except KeyError:
+            raise KeyError(f"Unknown asset '{asset_id}'") from None
+
+    def indices(self, asset_ids: npt.ArrayLike) -> np.ndarray:
+        """
+        Rows of several assets by id
+        """
+        keys = np.asarray(asset_ids, dtype=np.str_).reshape(-1)
+        if self._sorted_ids is None:
+            self._id_order = np.argsort(self.ids, kind="stable")
+            self._sorted_ids = self.ids[self._id_order]
+        positions = np.searchsorted(self._sorted_ids, keys)
+        known = positions < len(self._sorted_ids)
+        known[known] = self._sorted_ids[positions[known]] == keys[known]
+        if not known.all():
+            raise KeyError(f"Unknown asset '{keys[~known][0]}'")
+        return self._id_order[positions]
+
+    def of_type(self, *asset_types: AssetType) -> np.ndarray:
+        """
+        Rows, in table order, of the given asset types
+        """
+        codes = [AssetTypeCodes[asset_type] for asset_type in asset_types]
+        return np.flatnonzero(np.isin(self.asset_types, codes))
+
+    def take(self, rows: npt.ArrayLike) -> "AssetTable":
+        """
+        New table of the given rows, e.g. ``table.take(table.of_type(AssetType.Line))``
+        """
+        rows = np.asarray(rows)
+        return AssetTable(self.ids[rows], self.names[rows], self.asset_types[rows], self.coordinates[rows])
+
+    def model(self, row: int) -> Model:
+        """
+        ``Model`` of one row
+        """
+        x, y = self.coordinates[row].tolist()
+        return Model(
+            id=str(self.ids[row]),
+            name=str(self.names[row]),
+            coordinates=None if np.isnan(x) or np.isnan(y) else (x, y),
+            asset_type=AssetTypes[self.asset_types[row]],
+        )
+
+    def to_models(self, rows: Optional[Sequence[int]] = None) -> list[Model]:
+        """
+        ``Model`` of every row, or of the given rows
+        """
+        return [self.model(row) for row in (range(len(self)) if rows is None else rows)]
@@ -0,0 +1,236 @@
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from pyohm.network.arrays import ranges
+from pyohm.network.assets.table import AssetTable
+
+# Average number of points per grid cell when the cell size is not given
+PointsPerCell: int = 4
+
+# Pending inserts, as a fraction of the indexed points, which trigger a rebuild of the grid
+RebuildFraction: float = 0.1
+
+# Query points gathered in one batch by radius and nearest neighbour queries, bounds the memory
+# of the candidate arrays and keeps query numbers within uint16 for radix sorting
+QueryBatchSize: int = 4096
+
+
+def _slices(keys: np.ndarray, first: np.ndarray, last: np.ndarray, owners: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Positions in the sorted ``keys`` of every key from ``first`` to ``last`` of each row of cells,
+    with the owner of their row
+    """
+    starts = np.searchsorted(keys, first, "left")
+    stops = np.searchsorted(keys, last, "right")
+    return ranges(starts, stops), np.repeat(owners, stops - starts)
+
+
+class SpatialIndex:
+    """
+    Uniform grid index of 2-D points, e.g. asset coordinates, with integer ids.
+
+    Points are sorted by grid cell so a cell is a contiguous slice found by binary search,
+    and a box query reads one slice per row of cells. Distances are Euclidean in coordinate
+    units, project latitudes and longitudes first for metric distances.
+
+    Inserted points are kept in a small unsorted buffer until they exceed ``RebuildFraction``
+    of the index and deleted points are masked, ``rebuild`` folds both into the grid.
+    """
+
+    def __init__(
+        self, coordinates: npt.ArrayLike, ids: Optional[npt.ArrayLike] = None, cell_size: Optional[float] = None
+    ) -> None:
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        ids = np.arange(len(coordinates)) if ids is None else np.asarray(ids, dtype=np.int64)
+        if len(ids) != len(coordinates):
+            raise ValueError("coordinates and ids must have the same length")
+        if not np.isfinite(coordinates).all():
+            raise ValueError("coordinates must be finite")
+        self._fixed_cell_size = cell_size
+        self._build(coordinates, ids)
+
+    @classmethod
+    def from_table(cls, table: AssetTable, cell_size: Optional[float] = None) -> "SpatialIndex":
+        """
+        Index of the assets of ``table`` which have coordinates, ids are table rows
+        """
+        rows = np.flatnonzero(np.isfinite(table.coordinates).all(axis=1))
+        return cls(table.coordinates[rows], rows, cell_size)
+
+    def _build(self, coordinates: np.ndarray, ids: np.ndarray) -> None:
+        if len(coordinates):
+            self._origin = coordinates.min(axis=0)
+            extent = coordinates.max(axis=0) - self._origin
+        else:
+            self._origin, extent = np.zeros(2), np.zeros(2)
+
+        cell_size = self._fixed_cell_size
+        if cell_size is None:
+            area = float(np.prod(np.maximum(extent, extent.max() * 1e-3)))
+            cell_size = np.sqrt(area * PointsPerCell / len(coordinates)) if area > 0 else 1.0
+        self.cell_size = float(cell_size)
+        self._shape = (extent // self.cell_size).astype(np.int64) + 1
+
+        keys = self._keys(coordinates)
+        order = np.argsort(keys, kind="stable")
+        self._cell_keys = keys[order]
+        self._points = coordinates[order]
+        self._ids = ids[order]
+        self._alive = np.ones(len(order), dtype=bool)
+        self._id_order = np.argsort(self._ids, kind="stable")
+        self._pending_points = np.empty((0, 2))
+        self._pending_ids = np.empty(0, dtype=np.int64)
+        self._pending_keys = np.empty(0, dtype=np.int64)
+
+    def _cells(self, coordinates: np.ndarray) -> npt.NDArray[np.int64]:
+        cells = np.floor((coordinates - self._origin) / self.cell_size)
+        return np.asarray(np.clip(cells, 0, self._shape - 1), dtype=np.int64)
+
+    def _keys(self, coordinates: np.ndarray) -> np.ndarray:
+        cells = self._cells(coordinates)
+        return cells[:, 1] * int(self._shape[0]) + cells[:, 0]
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._alive)) + len(self._pending_ids)
+
+    def insert(self, coordinates: npt.ArrayLike, ids: npt.ArrayLike) -> None:
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if len(ids) != len(coordinates):
+            raise ValueError("coordinates and ids must have the same length")
+        if not np.isfinite(coordinates).all():
+            raise ValueError("coordinates must be finite")
+        if len(self._pending_ids) + len(ids) > max(1024, RebuildFraction * len(self._ids)):
+            self._pending_points = np.concatenate([self._pending_points, coordinates])
+            self._pending_ids = np.concatenate([self._pending_ids, ids])
+            self.rebuild()
+            return
+        # the buffer is sorted by grid cell too, points outside the grid fall in its edge cells
+        keys = np.concatenate([self._pending_keys, self._keys(coordinates)])
+        order = np.argsort(keys, kind="stable")
+        self._pending_keys = keys[order]
+        self._pending_points = np.concatenate([self._pending_points, coordinates])[order]
+        self._pending_ids = np.concatenate([self._pending_ids, ids])[order]
+
+    def delete(self, ids: npt.ArrayLike) -> int:
+        """
+        Remove every point with one of ``ids``, returns the number of removed points
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        sorted_ids = self._ids[self._id_order]
+        start = np.searchsorted(sorted_ids, ids, "left")
+        stop = np.searchsorted(sorted_ids, ids, "right")
+        slots = self._id_order[ranges(start, stop)]
+        removed = int(np.count_nonzero(self._alive[slots]))
+        self._alive[slots] = False
+
+        pending = np.isin(self._pending_ids, ids)
+        removed += int(np.count_nonzero(pending))
+        self._pending_points = self._pending_points[~pending]
+        self._pending_ids = self._pending_ids[~pending]
+        self._pending_keys = self._pending_keys[~pending]
+        return removed
+
+    def rebuild(self) -> None:
+        """
+        Fold inserted and deleted points into the grid
+        """
+        self._build(
+            np.concatenate([self._points[self._alive], self._pending_points]),
+            np.concatenate([self._ids[self._alive], self._pending_ids]),
+        )
+
+    def _candidates(self, lower: np.ndarray, upper: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Query, point and id of every candidate of a batch of boxes from ``lower`` to ``upper``,
+        shape (queries, 2): the points of the grid cells and of the pending buffer overlapping each
+        box, grouped by query in query order
+        """
+        queries = len(lower)
+        (x0, y0), (x1, y1) = self._cells(lower).T, self._cells(upper).T
+        rows = y1 - y0 + 1
+        row_queries = np.repeat(np.arange(queries), rows)
+        first = ranges(y0, y1 + 1) * self._shape[0] + x0[row_queries]
+        last = first + (x1 - x0)[row_queries]
+
+        slots, owners = _slices(self._cell_keys, first, last, row_queries)
+        alive = self._alive[slots]
+        slots, owners = slots[alive], owners[alive]
+        if not len(self._pending_ids):
+            return owners, self._points[slots], self._ids[slots]
+
+        pending, pending_owners = _slices(self._pending_keys, first, last, row_queries)
+        owners = np.concatenate([owners, pending_owners])
+        order = np.argsort(owners, kind="stable")
+        points = np.concatenate([self._points[slots], self._pending_points[pending]])[order]
+        ids = np.concatenate([self._ids[slots], self._pending_ids[pending]])[order]
+        return owners[order], points, ids
+
+    def query_box(self, lower: npt.ArrayLike, upper: npt.ArrayLike) -> np.ndarray:
+        """
+        Ids of the points inside the box from ``lower`` (x, y) to ``upper`` (x, y), bounds included
+        """
+        lower, upper = np.asarray(lower, dtype=np.float64), np.asarray(upper, dtype=np.float64)
+        _, points, ids = self._candidates(lower.reshape(1, 2), upper.reshape(1, 2))
+        return ids[np.all((points >= lower) & (points <= upper), axis=1)]
+
+    def query_radius(self, points: npt.ArrayLike, radius: float) -> list[np.ndarray]:
+        """
+        Ids of the indexed points within ``radius`` of every query point, one array per query point.
+        The candidates of up to ``QueryBatchSize`` query points are gathered and filtered in one batch.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result: list[np.ndarray] = []
+        for start in range(0, len(points), QueryBatchSize):
+            batch = points[start : start + QueryBatchSize]
+            owners, candidates, ids = self._candidates(batch - radius, batch + radius)
+            inside = np.sum((candidates - batch[owners]) ** 2, axis=1) <= radius**2
+            counts = np.bincount(owners[inside], minlength=len(batch))
+            result.extend(np.split(ids[inside], np.cumsum(counts)[:-1]))
+        return result
+
+    def query_nearest(self, points: npt.ArrayLike, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Distances and ids of the ``k`` nearest points of every query point, shape (queries, k),
+        sorted by distance. Padded with inf and -1 when the index holds fewer than ``k`` points.
+
+        The search box of every query point grows from one cell until it holds ``k`` points within
+        its half width, so the cost follows the local density rather than the size of the index.
+        Each round gathers the candidates of up to ``QueryBatchSize`` unresolved query points in
+        one batch and ranks them per query point with one sort by distance and one radix sort by
+        query point.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        distances = np.full((len(points), k), np.inf)
+        ids = np.full((len(points), k), -1, dtype=np.int64)
+        total = len(self)
+        if total == 0:
+            return distances, ids
+
+        radius = np.full(len(points), self.cell_size)
+        for start in range(0, len(points), QueryBatchSize):
+            active = np.arange(start, min(start + QueryBatchSize, len(points)))
+            while len(active):
+                query, limit = points[active], radius[active]
+                owners, candidates, candidate_ids = self._candidates(query - limit[:, None], query + limit[:, None])
+                squared = np.sum((candidates - query[owners]) ** 2, axis=1)
+                within = squared <= limit[owners] ** 2
+                exhausted = np.bincount(owners, minlength=len(active)) == total
+                done = (np.bincount(owners[within], minlength=len(active)) >= k) | exhausted
+
+                # with k points inside the search radius the k nearest are among them
+                keep = np.flatnonzero(done[owners] & (within | exhausted[owners]))
+                order = keep[np.argsort(squared[keep])]
+                order = order[np.argsort(owners[order].astype(np.uint16), kind="stable")]
+                counts = np.bincount(owners[order], minlength=len(active))
+                rank = np.arange(len(order)) - np.repeat(np.cumsum(counts) - counts, counts)
+                nearest = order[rank < k]
+                rows, rank = active[owners[nearest]], rank[rank < k]
+                distances[rows, rank] = np.sqrt(squared[nearest])
+                ids[rows, rank] = candidate_ids[nearest]
+
+                active = active[~done]
+                radius[active] *= 2
+        return distances, ids
@@ -2,3 +2,4 @@ Kciml = "kcmil"
 Meter = "meter"
 DegreeC = "degreeC"
 OhmPerMeter = "ohm/m"
+JoulePerMeterDegreeC = "J/(m*degreeC)"
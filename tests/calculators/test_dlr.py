@@ -0,0 +1,58 @@
+import csv
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from pyohm.calculators.dlr import rate_chunks, rate_weather_file, read_weather_csv, read_weather_npy
+from pyohm.models.conductor import Conductor
+
+
+def _expected(wind_speed, ambient_temperature, date):
+    conductor = Conductor()
+    conductor.use_default()
+    conductor.wind_speed = wind_speed
+    conductor.ambient_temperature = ambient_temperature
+    conductor.date = date
+    return conductor.conductor_current
+
+
+def test_rate_weather_csv(tmp_path):
+    dates = [datetime(2023, 6, 10) + timedelta(hours=hour) for hour in range(8, 16)]
+    source = tmp_path / "weather.csv"
+    with open(source, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["span", "date", "wind_speed", "ambient_temperature"])
+        for i, date in enumerate(dates):
+            writer.writerow([f"S{i}", date.isoformat(), 0.5 + i / 4, 20 + i])
+
+    chunks = list(read_weather_csv(source, chunk_size=3))
+
+    assert [len(chunk["date"]) for chunk in chunks] == [3, 3, 2]
+
+    destination = tmp_path / "ratings.csv"
+    rows = rate_weather_file(source, destination, chunk_size=3, max_allowable_conductor_temperature=100.0)
+
+    assert rows == len(dates)
+
+    with open(destination, newline="") as f:
+        ratings = list(csv.DictReader(f))
+
+    for i, (date, row) in enumerate(zip(dates, ratings)):
+        assert row["span"] == f"S{i}"
+        assert float(row["conductor_current"]) == pytest.approx(_expected(0.5 + i / 4, 20 + i, date))
+
+
+def test_rate_weather_npy(tmp_path):
+    table = np.zeros(10, dtype=[("date", "datetime64[s]"), ("wind_speed", "f8"), ("ambient_temperature", "f8")])
+    table["date"] = np.datetime64("2023-06-10T11:00:00")
+    table["wind_speed"] = np.linspace(0.5, 5.0, 10)
+    table["ambient_temperature"] = 30.0
+    np.save(tmp_path / "weather.npy", table)
+
+    ratings = list(rate_chunks(read_weather_npy(tmp_path / "weather.npy", chunk_size=4)))
+    current = np.concatenate([chunk["conductor_current"] for chunk in ratings])
+
+    expected = [_expected(speed, 30.0, datetime(2023, 6, 10, 11)) for speed in table["wind_speed"]]
+
+    assert current == pytest.approx(expected)
@@ -0,0 +1,23 @@
+import numpy as np
+
+from pyohm.calculators.fleet import rate_fleet
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def test_rate_fleet_matches_serial():
+    rng = np.random.default_rng(0)
+    spans, hours = 50, 24
+    inputs = {
+        "wind_speed": rng.uniform(0.5, 10.0, (spans, hours)),
+        "ambient_temperature": rng.uniform(-10.0, 40.0, (spans, 1)),
+        "latitude": rng.uniform(25.0, 50.0, (spans, 1)),
+        "date": np.datetime64("2023-06-10T00:00:00") + np.arange(hours) * np.timedelta64(1, "h"),
+    }
+
+    current = rate_fleet(inputs, processes=2, max_allowable_conductor_temperature=90.0)
+
+    expected = ConductorBatch(**inputs, max_allowable_conductor_temperature=90.0).conductor_current
+
+    assert current.shape == (spans, hours)
+    np.testing.assert_array_equal(current, expected)
+    np.testing.assert_array_equal(rate_fleet(inputs, processes=1, max_allowable_conductor_temperature=90.0), expected)
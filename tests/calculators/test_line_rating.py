@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from pyohm.calculators.line_rating import LineRating
+from pyohm.models.conductor import Conductor
+
+
+def test_line_rating_limiting_span():
+    azimuth = np.array([0.0, 45.0, 90.0, 135.0])
+    latitude = np.array([30.0, 30.1, 30.2, 30.3])
+    elevation = np.array([0.0, 100.0, 500.0, 1000.0])
+    line = LineRating(azimuth_of_conductor=azimuth, latitude=latitude, elevation=elevation)
+
+    date = np.datetime64("2023-06-10T08:00") + np.arange(6) * np.timedelta64(90, "m")
+    wind_speed = np.linspace(0.5, 3.0, 6)
+    # wind almost parallel to span 2 cools it least
+    wind_direction = np.tile([90.0, 90.0, 5.0, 90.0], (6, 1))
+
+    result = line.rate(date, chunk_size=4, wind_speed=wind_speed, wind_direction=wind_direction)
+
+    assert result.span_ratings.shape == (6, 4)
+    assert result.rating == pytest.approx(result.span_ratings.min(axis=1))
+    assert result.limiting_span.tolist() == [2] * 6
+
+    for t in (0, 5):
+        for s in range(4):
+            conductor = Conductor()
+            conductor.use_default()
+            conductor.azimuth_of_conductor = azimuth[s]
+            conductor.latitude = latitude[s]
+            conductor.elevation = elevation[s]
+            conductor.date = date[t].astype(object)
+            conductor.wind_speed = wind_speed[t]
+            conductor.wind_direction = wind_direction[t, s]
+
+            assert result.span_ratings[t, s] == pytest.approx(conductor.conductor_current)
+
+
+def test_line_rating_many_spans():
+    spans = 5000
+    line = LineRating(azimuth_of_conductor=np.linspace(0.0, 180.0, spans))
+
+    result = line.rate(np.datetime64("2023-06-10T11:00"), wind_speed=2.0)
+
+    assert result.span_ratings.shape == (1, spans)
+    assert result.rating[0] == result.span_ratings[0, result.limiting_span[0]]
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from pyohm.calculators.probabilistic import QuantileHistogram, normal, probabilistic_ampacity, von_mises, weibull
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def _distributions():
+    return {
+        "wind_speed": weibull(2.0, np.array([1.0, 2.0, 4.0])),
+        "wind_direction": von_mises(90.0, 2.0),
+        "ambient_temperature": normal(np.array([35.0, 25.0, 10.0]), 3.0),
+    }
+
+
+def test_probabilistic_ampacity_matches_sample_quantiles():
+    spans, samples = 3, 20_000
+    quantiles = probabilistic_ampacity(spans, _distributions(), samples=samples, chunk_size=samples, seed=0)
+
+    rng = np.random.default_rng(0)
+    drawn = {key: sampler(rng, (spans, samples)) for key, sampler in _distributions().items()}
+    current = ConductorBatch(**drawn).conductor_current
+    expected = np.quantile(current, [0.05, 0.5, 0.95], axis=1)
+
+    assert quantiles.shape == (3, spans)
+    assert quantiles == pytest.approx(expected, rel=2e-3)
+
+
+def test_probabilistic_ampacity_chunked_and_reproducible():
+    kwargs = dict(spans=3, distributions=_distributions(), samples=20_000, chunk_size=1_000)
+
+    chunked = probabilistic_ampacity(**kwargs, seed=1, latitude=np.array([30.0, 40.0, 50.0]))
+
+    assert np.array_equal(chunked, probabilistic_ampacity(**kwargs, seed=1, latitude=np.array([30.0, 40.0, 50.0])))
+    assert np.all(np.diff(chunked, axis=0) > 0)
+
+    single = probabilistic_ampacity(**{**kwargs, "chunk_size": 20_000}, seed=2, latitude=np.array([30.0, 40.0, 50.0]))
+
+    assert chunked == pytest.approx(single, rel=0.03)
+
+
+def test_quantile_histogram_grows_range():
+    rng = np.random.default_rng(0)
+    chunks = [
+        np.full((2, 100), np.nan),
+        np.stack([rng.normal(10.0, 0.1, 100), np.full(100, np.nan)]),
+        np.stack([rng.normal(12.0, 1.0, 1000), rng.normal(-5.0, 1.0, 1000)]),
+        np.stack([rng.normal(5.0, 2.0, 1000), rng.normal(0.0, 10.0, 1000)]),
+    ]
+    histogram = QuantileHistogram(2, bins=4096)
+    for chunk in chunks:
+        histogram.add(chunk)
+
+    values = np.concatenate(chunks, axis=1)
+    expected = np.nanquantile(values, [0.05, 0.5, 0.95], axis=1)
+    width = histogram.width
+
+    assert histogram.counts.sum(axis=1).tolist() == np.isfinite(values).sum(axis=1).tolist()
+    assert np.all(np.abs(histogram.quantiles([0.05, 0.5, 0.95]) - expected) <= 2 * width)
+    assert np.isnan(QuantileHistogram(2).quantiles([0.5])).all()
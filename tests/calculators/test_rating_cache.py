@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+from pyohm.calculators.rating_cache import RatingCache
+from pyohm.models.catalog import conductor_catalog
+from pyohm.models.conductor import Conductor, ConductorState
+
+
+def test_rating_cache():
+    cache = RatingCache(maxsize=2)
+
+    assert cache.conductor_current(wind_speed=0.61) == pytest.approx(Conductor(ConductorState(wind_speed=0.6)).I)
+    assert cache.conductor_current(wind_speed=0.62, date=datetime(2023, 6, 10, 11, 0, 20)) == cache.conductor_current()
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+
+    cache.conductor_current(wind_speed=2.0)
+    cache.conductor_current()
+    cache.conductor_current(wind_speed=3.0)
+
+    assert cache.evictions == 1
+    assert ConductorState(wind_speed=0.6) in cache
+    assert ConductorState(wind_speed=2.0) not in cache
+
+
+def test_rating_cache_spec_and_invalidate():
+    catalog = conductor_catalog()
+    cache = RatingCache()
+    for code_word in ("Drake", "Linnet"):
+        for wind_speed in (0.5, 1.0, 2.0):
+            cache.conductor_current(spec=catalog.spec(code_word, "ACSR"), wind_speed=wind_speed)
+
+    conductor = Conductor(ConductorState(wind_speed=1.0))
+    conductor.use_spec(catalog.spec("Linnet", "ACSR"))
+    assert cache.conductor_current(spec=catalog.spec("Linnet", "ACSR"), wind_speed=1.0) == pytest.approx(conductor.I)
+    assert len(cache) == 6
+
+    assert cache.invalidate(spec=catalog.spec("Linnet", "ACSR")) == 3
+    assert cache.invalidate(wind_speed=0.5) == 1
+    assert cache.invalidate() == 2
+    assert len(cache) == 0
+
+    cache.clear()
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+    for wind_speed in (0.3, 0.7, 1.0):
+        cache.conductor_current(wind_speed=wind_speed)
+
+    assert cache.invalidate(wind_speed=0.3) == 1
+    assert cache.invalidate(wind_speed=0.71) == 1
+    assert len(cache) == 1
+
+    with pytest.raises(TypeError):
+        RatingCache(resolutions={"wind": 0.1})
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from pyohm.calculators import rating_table
+from pyohm.calculators.rating_table import RatingTable
+from pyohm.models.catalog import conductor_catalog
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+@pytest.mark.parametrize("code_word, tolerance", [("Linnet", None), ("Bluebird", None), ("Bluebird", 25.0)])
+def test_rating_table_lookup(code_word, tolerance):
+    spec = conductor_catalog().spec(code_word, "ACSR")
+    table = RatingTable.build(spec, tolerance=tolerance, emissivity=0.5)
+
+    # random points between the grid nodes
+    rng = np.random.default_rng(0)
+    wind_speed = rng.uniform(0.0, 20.0, 100_000)
+    wind_direction = rng.uniform(0.0, 360.0, 100_000)
+    ambient_temperature = rng.uniform(-40.0, 50.0, 100_000)
+    solar_heat_gain = rng.uniform(0.0, 40.0, 100_000)
+    batch = ConductorBatch(
+        wind_speed=wind_speed,
+        wind_direction=wind_direction,
+        ambient_temperature=ambient_temperature,
+        conductor_outside_diameter=spec.diameter,
+        conductor_ac_resistance_low=spec.ac_resistance_low,
+        conductor_ac_resistance_high=spec.ac_resistance_high,
+        emissivity=0.5,
+    )
+    # 0 A where no current is sustainable
+    squared_current = (batch.q_c + batch.q_r - solar_heat_gain) / batch.R_avg
+    expected = np.sqrt(np.maximum(squared_current, 0.0))
+
+    current = table.lookup(wind_speed, wind_direction, ambient_temperature, solar_heat_gain)
+
+    assert 0 < table.error_bound <= (tolerance or np.inf)
+    assert np.all(np.abs(current - expected) <= table.error_bound)
+
+    node = [axis[3] for axis in table.axes]
+    assert table.lookup(*node) == pytest.approx(np.sqrt(table.values[3, 3, 3, 3]))
+    assert np.isnan(table.lookup(25.0, 90.0, 20.0, 10.0))
+
+
+def test_rating_table_tolerance_not_met(monkeypatch):
+    monkeypatch.setattr(rating_table, "MaxTableValues", 1_000_000)
+
+    with pytest.raises(ValueError):
+        RatingTable.build(tolerance=1.0)
+
+
+def test_rating_table_save_load(tmp_path):
+    table = RatingTable.build(axes={"wind_speed": [0.5, 1.0, 2.0], "solar_heat_gain": [0.0, 20.0]})
+    table.save(tmp_path / "drake")
+
+    loaded = RatingTable.load(tmp_path / "drake")
+
+    assert isinstance(loaded.values, np.memmap)
+    assert loaded.error_bound == table.error_bound
+    assert loaded.lookup(1.5, 45.0, 25.0, 10.0) == table.lookup(1.5, 45.0, 25.0, 10.0)
+
+    with pytest.raises(ValueError):
+        RatingTable.build(axes={"wind_speed": [2.0, 1.0]})
+    with pytest.raises(TypeError):
+        RatingTable.build(axes={"wind": [1.0, 2.0]})
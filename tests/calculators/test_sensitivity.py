@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from pyohm.calculators.sensitivity import ampacity_sensitivities
+from pyohm.models.conductor import Conductor, ConductorState
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def _finite_difference(state, key, step):
+    upper = Conductor(state._replace(**{key: getattr(state, key) + step})).conductor_current
+    lower = Conductor(state._replace(**{key: getattr(state, key) - step})).conductor_current
+    return (upper - lower) / (2 * step)
+
+
+def test_ampacity_sensitivities_match_finite_differences():
+    wind_speed = np.array([0.3, 0.61, 2.0, 8.0])
+    wind_direction = np.array([20.0, 90.0, 45.0, 170.0])
+    ambient_temperature = np.array([-5.0, 40.0, 20.0, 35.0])
+
+    batch = ConductorBatch(
+        wind_speed=wind_speed, wind_direction=wind_direction, ambient_temperature=ambient_temperature
+    )
+    sensitivities = ampacity_sensitivities(batch)
+
+    assert sensitivities.conductor_current == pytest.approx(batch.conductor_current)
+
+    for i in range(len(wind_speed)):
+        state = ConductorState(
+            wind_speed=wind_speed[i], wind_direction=wind_direction[i], ambient_temperature=ambient_temperature[i]
+        )
+        for key, step in (("wind_speed", 1e-5), ("wind_direction", 1e-4), ("ambient_temperature", 1e-4)):
+            assert getattr(sensitivities, key)[i] == pytest.approx(_finite_difference(state, key, step), rel=1e-4)
+
+        conductor = Conductor(state)
+        gain = conductor.solar_heat_gain
+        conductor.solar_absorption = state.solar_absorption * (gain + 1e-3) / gain
+        upper = conductor.conductor_current
+        conductor.solar_absorption = state.solar_absorption * (gain - 1e-3) / gain
+        lower = conductor.conductor_current
+
+        assert sensitivities.solar_heat_gain[i] == pytest.approx((upper - lower) / 2e-3, rel=1e-4)
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from pyohm.calculators.steady_state import solve_conductor_temperature
+from pyohm.models.conductor import Conductor
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def test_solve_conductor_temperature():
+    conductor = Conductor()
+    conductor.use_default()
+
+    batch = ConductorBatch()
+
+    temperature = solve_conductor_temperature(batch, [conductor.I, 1200.0])
+
+    assert temperature == pytest.approx([100.0, 119.6], abs=0.2)
+
+    assert batch.conductor_current == pytest.approx([conductor.I, 1200.0])
+
+
+def test_solve_conductor_temperature_many_spans():
+    rng = np.random.default_rng(0)
+    wind_speed = rng.uniform(0.5, 10.0, 1000)
+    ambient_temperature = rng.uniform(-10.0, 40.0, 1000)
+    current = rng.uniform(100.0, 1500.0, 1000)
+
+    batch = ConductorBatch(wind_speed=wind_speed, ambient_temperature=ambient_temperature)
+    temperature = solve_conductor_temperature(batch, current)
+
+    assert np.all(temperature > ambient_temperature)
+    assert batch.conductor_current == pytest.approx(current, rel=1e-6)
+
+    warm = solve_conductor_temperature(batch, current * 1.01, initial_temperature=temperature)
+
+    assert np.all(warm > temperature)
+
+
+def test_solve_conductor_temperature_out_of_range():
+    batch = ConductorBatch()
+
+    temperature = solve_conductor_temperature(batch, [1e5], maximum_temperature=200.0)
+
+    assert np.isnan(temperature).all()
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from pyohm.calculators.steady_state import solve_conductor_temperature
+from pyohm.calculators.transient import simulate_transient
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def test_simulate_transient_reaches_steady_state():
+    time = np.arange(0, 4 * 3600 + 1, 600.0)
+    current = np.full((len(time), 2), [1025.0, 1200.0])
+
+    batch = ConductorBatch()
+    temperatures = simulate_transient(batch, time, current, initial_temperature=40.0)
+
+    assert temperatures.shape == (len(time), 2)
+    assert np.all(np.diff(temperatures, axis=0) >= 0)
+
+    steady = solve_conductor_temperature(ConductorBatch(), current[0])
+
+    assert temperatures[-1] == pytest.approx(steady, abs=0.01)
+
+
+def test_simulate_transient_fixed_step_matches_adaptive():
+    time = np.arange(0, 3600 + 1, 300.0)
+    current = np.where(time < 1800, 800.0, 1500.0)[:, None] * np.ones(3)
+    weather = {"wind_speed": np.linspace(0.61, 3.0, len(time))[:, None] * np.ones(3)}
+
+    adaptive = simulate_transient(ConductorBatch(), time, current, 60.0, weather=weather)
+    fixed = simulate_transient(ConductorBatch(), time, current, 60.0, weather=weather, adaptive=False)
+
+    assert adaptive == pytest.approx(fixed, abs=0.05)
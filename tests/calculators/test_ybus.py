@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from pyohm.calculators.ybus import branch_admittances, build_ybus
+
+
+def _dense_ybus(buses, branches, bus_shunt):
+    ybus = np.diag(np.asarray(bus_shunt, dtype=np.complex128))
+    for f, t, r, x, b, tap, shift in branches:
+        series = 1 / complex(r, x)
+        ratio = (tap or 1.0) * np.exp(1j * np.radians(shift))
+        ybus[f, f] += (series + 0.5j * b) / abs(ratio) ** 2
+        ybus[f, t] += -series / np.conj(ratio)
+        ybus[t, f] += -series / ratio
+        ybus[t, t] += series + 0.5j * b
+    return ybus
+
+
+def test_build_ybus():
+    branches = [
+        (0, 1, 0.01, 0.1, 0.02, 0.0, 0.0),
+        (1, 2, 0.02, 0.2, 0.04, 0.0, 0.0),
+        (0, 2, 0.0, 0.05, 0.0, 0.98, 5.0),
+        (0, 1, 0.01, 0.1, 0.02, 0.0, 0.0),
+    ]
+    bus_shunt = [0.0, 0.01 + 0.05j, 0.0, 0.0]
+    f, t, r, x, b, tap, shift = (np.array(column) for column in zip(*branches))
+
+    ybus = build_ybus(4, f, t, r, x, b, tap, shift, bus_shunt=bus_shunt)
+
+    assert ybus.shape == (4, 4)
+    assert ybus.to_dense() == pytest.approx(_dense_ybus(4, branches, bus_shunt))
+    assert np.all(np.diff(ybus.indices[ybus.indptr[0] : ybus.indptr[1]]) > 0)
+
+    voltage = np.exp(1j * np.radians([0.0, -2.0, -4.0, 0.0]))
+    assert ybus.dot(voltage) == pytest.approx(_dense_ybus(4, branches, bus_shunt) @ voltage)
+
+    open_branch = build_ybus(4, f, t, r, x, b, tap, shift, in_service=[True, True, False, True])
+    assert open_branch.to_dense() == pytest.approx(_dense_ybus(4, branches[:2] + branches[3:], np.zeros(4)))
+
+    with pytest.raises(ValueError):
+        build_ybus(2, [0], [2], 0.01, 0.1)
+
+
+def test_branch_admittances_line_is_symmetric():
+    admittances = branch_admittances([0.01, 0.0], [0.1, 0.05], tap=[0.0, 1.0])
+
+    assert admittances.from_to == pytest.approx(admittances.to_from)
+    assert admittances.from_from == pytest.approx(admittances.to_to)
+
+
+def test_branch_admittances_zero_impedance():
+    with pytest.raises(ValueError, match=r"Branches \[1, 3\]"):
+        branch_admittances([0.01, 0.0, 0.02, 0.0], [0.1, 0.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        build_ybus(3, [0, 1], [1, 2], 0.0, [0.1, 0.0])
+
+    ybus = build_ybus(3, [0, 1], [1, 2], [0.01, 0.0], [0.1, 0.0], in_service=[True, False])
+    assert ybus.to_dense() == pytest.approx(build_ybus(3, [0], [1], 0.01, 0.1).to_dense())
+
+
+def test_ybus_to_scipy():
+    ybus = build_ybus(3, [0, 1], [1, 2], 0.01, 0.1)
+
+    assert ybus.to_scipy().toarray() == pytest.approx(ybus.to_dense())
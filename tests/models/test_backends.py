@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from pyohm.models import backends
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def _batch():
+    rng = np.random.default_rng(0)
+    return ConductorBatch(
+        wind_speed=rng.uniform(0.5, 10.0, (200, 1)),
+        wind_direction=rng.uniform(0.0, 180.0, (200, 1)),
+        ambient_temperature=rng.uniform(-10.0, 40.0, (200, 1)),
+        latitude=rng.uniform(25.0, 50.0, (200, 1)),
+        clear_atmosphere=rng.uniform(size=(200, 1)) > 0.5,
+        date=np.datetime64("2023-06-10T06:00") + np.arange(0, 720, 20) * np.timedelta64(1, "m"),
+    )
+
+
+@pytest.mark.parametrize("backend", backends.available_backends())
+def test_backends_agree(backend):
+    batch = _batch()
+
+    current = batch.rate(backend)
+
+    assert current.shape == batch.shape
+    np.testing.assert_allclose(current, batch.conductor_current, rtol=1e-12)
+
+
+def test_numba_backend():
+    pytest.importorskip("numba")
+
+    assert backends.get_backend() is backends.Backends["numpy"]
+    np.testing.assert_allclose(_batch().rate("numba"), _batch().rate("numpy"), rtol=1e-12)
+
+
+def test_heat_balance_kernel_parity():
+    rng = np.random.default_rng(1)
+    size = 2000
+    batch = ConductorBatch(
+        wind_speed=rng.uniform(0.1, 30.0, size),
+        wind_direction=rng.uniform(0.0, 360.0, size),
+        emissivity=rng.uniform(0.1, 1.0, size),
+        solar_absorption=rng.uniform(0.1, 1.0, size),
+        ambient_temperature=rng.uniform(-40.0, 50.0, size),
+        conductor_surface_temperature=rng.uniform(-40.0, 250.0, size),
+        max_allowable_conductor_temperature=rng.uniform(50.0, 250.0, size),
+        azimuth_of_conductor=rng.uniform(0.0, 360.0, size),
+        latitude=rng.uniform(-80.0, 80.0, size),
+        clear_atmosphere=rng.uniform(size=size) > 0.5,
+        elevation=rng.uniform(0.0, 4000.0, size),
+        date=np.datetime64("2023-01-01") + rng.integers(0, 365 * 24 * 60, size) * np.timedelta64(1, "m"),
+    )
+    current = np.empty(size)
+    backends.heat_balance_kernel(*backends.kernel_arrays(batch), backends.SolarHeatIntensityCoefficients, current)
+
+    with np.errstate(invalid="ignore"):
+        expected = batch.conductor_current
+    assert np.count_nonzero(np.isfinite(expected)) > size // 4
+    np.testing.assert_allclose(current, expected, rtol=1e-10)
+
+
+def test_register_backend():
+    backends.register_backend("constant", lambda batch: np.ones(batch.shape))
+    try:
+        assert np.all(_batch().rate("constant") == 1)
+    finally:
+        del backends.Backends["constant"]
+
+    with pytest.raises(KeyError):
+        _batch().rate("constant")
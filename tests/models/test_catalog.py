@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from pyohm.models.catalog import conductor_catalog
+from pyohm.models.conductor import Conductor, DrakeConductorSpec
+from pyohm.models.conductor_batch import ConductorBatch
+
+
+def test_catalog_lookup():
+    catalog = conductor_catalog()
+
+    assert catalog is conductor_catalog()
+    assert set(catalog.columns["family"]) == {"ACSR", "AAC", "AAAC", "ACSS"}
+
+    drake = catalog.spec("Drake/ACSR")
+
+    for key in ("kcmil", "diameter", "low_temperature", "high_temperature", "ac_resistance_low", "heat_capacity"):
+        assert getattr(drake, key) == getattr(DrakeConductorSpec, key)
+
+    assert catalog.index("arbutus") == catalog.index("Arbutus/AAC")
+    assert catalog.spec("Drake", family="ACSS").high_temperature == 200.0
+    assert "Hawk" in catalog
+
+    with pytest.raises(KeyError):
+        catalog.index("Drake")
+
+    with pytest.raises(KeyError):
+        catalog.index("Unobtanium")
+
+
+def test_catalog_select():
+    catalog = conductor_catalog()
+
+    rows = catalog.select(family="ACSR", kcmil=(477, 795))
+
+    assert sorted(catalog.columns["code_word"][rows]) == ["Dove", "Drake", "Grosbeak", "Hawk", "Hen"]
+
+    rows = catalog.select(diameter=(0.025, 0.03))
+
+    assert np.all((catalog.columns["diameter"][rows] >= 0.025) & (catalog.columns["diameter"][rows] <= 0.03))
+    assert len(catalog.select(kcmil=(1e6, 2e6))) == 0
+
+
+def test_catalog_batch_inputs():
+    catalog = conductor_catalog()
+    rows = catalog.select(family="AAC")
+
+    batch = ConductorBatch(**catalog.batch_inputs(rows))
+
+    for row, current in zip(rows, batch.conductor_current):
+        conductor = Conductor()
+        conductor.use_default()
+        conductor.use_spec(catalog.spec(catalog.columns["name"][row]))
+
+        assert current == pytest.approx(conductor.conductor_current)
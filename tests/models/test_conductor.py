@@ -1,6 +1,9 @@
+from datetime import datetime
+
 import pytest
 
-from pyohm.models.conductor import Conductor
+from pyohm.models.base import derived
+from pyohm.models.conductor import Conductor, ConductorState
 
 
 def test_conductor():
@@ -41,3 +44,85 @@ def test_conductor():
     conductor.conductor_surface_temperature = 119.6
 
     assert conductor.I == pytest.approx(1200, abs=1)
+
+
+def test_conductor_solar_heat_elevation_factor():
+    conductor = Conductor()
+    conductor.use_default()
+    conductor.elevation = 1000.0
+
+    # IEEE 738 K_solar = 1 + 1.148e-4 * H_e - 1.108e-8 * H_e^2
+    assert conductor.total_solar_and_sky_radiated_heat_intensity_factor == pytest.approx(1.10372)
+
+    assert conductor.q_s > 0
+
+
+def test_conductor_invalidates_dependent_properties():
+    changes = {
+        "wind_speed": 2.0,
+        "wind_direction": 45.0,
+        "emissivity": 0.5,
+        "solar_absorption": 0.5,
+        "ambient_temperature": 20.0,
+        "conductor_surface_temperature": 80.0,
+        "max_allowable_conductor_temperature": 90.0,
+        "conductor_outside_diameter": 0.03,
+        "conductor_low_temperature": 20.0,
+        "conductor_high_temperature": 80.0,
+        "conductor_ac_resistance_low": 7e-5,
+        "conductor_ac_resistance_high": 9e-5,
+        "azimuth_of_conductor": 30.0,
+        "latitude": 45.0,
+        "clear_atmosphere": False,
+        "date": datetime(year=2023, month=3, day=1, hour=14),
+        "elevation": 500.0,
+    }
+    properties = [name for name, value in vars(Conductor).items() if isinstance(value, derived)]
+
+    for key, value in changes.items():
+        conductor = Conductor()
+        conductor.use_default()
+        for name in properties:
+            getattr(conductor, name)
+        setattr(conductor, key, value)
+
+        expected = Conductor()
+        expected.use_default()
+        setattr(expected, key, value)
+
+        for name in properties:
+            assert getattr(conductor, name) == getattr(expected, name), (key, name)
+
+
+def test_conductor_keeps_unaffected_properties_cached():
+    conductor = Conductor()
+    conductor.use_default()
+    conductor.conductor_current
+
+    conductor.wind_speed = 2.0
+
+    assert "solar_heat_gain" in conductor._cache
+    assert "radiated_heat_loss" in conductor._cache
+    assert "reynolds_number" not in conductor._cache
+    assert "conductor_current" not in conductor._cache
+
+
+def test_conductor_state():
+    expected = Conductor()
+    expected.use_default()
+
+    state = ConductorState()
+
+    assert Conductor(state).I == pytest.approx(expected.I)
+
+    state = ConductorState(conductor_surface_temperature=119.6)
+
+    assert Conductor(state).I == pytest.approx(1200, abs=1)
+    assert ConductorState(**state._asdict()) == state
+    assert ConductorState._make(tuple(state)) == state
+
+    with pytest.raises(AttributeError):
+        state.wind_speed = 1.0
+
+    assert not hasattr(state, "__dict__")
+    assert state.date is ConductorState().date
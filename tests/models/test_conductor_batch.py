@@ -0,0 +1,138 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pyohm.models import backends
+from pyohm.models.conductor import Conductor, ConductorState
+from pyohm.models.conductor_batch import ConductorBatch, Float32RelativeError
+
+
+def test_conductor_batch_matches_scalar():
+    conductor = Conductor()
+    conductor.use_default()
+
+    batch = ConductorBatch(conductor_surface_temperature=[100.0, 119.6])
+
+    assert batch.shape == (2,)
+
+    assert batch.t_film == pytest.approx(conductor.t_film)
+
+    assert batch.number_of_day == conductor.number_of_day
+
+    assert batch.p_f == pytest.approx(conductor.p_f)
+
+    assert batch.N_Re == pytest.approx(conductor.N_Re)
+
+    assert batch.H_c == pytest.approx(conductor.H_c)
+
+    assert batch.Z_c == pytest.approx(conductor.Z_c)
+
+    assert batch.Q_s == pytest.approx(conductor.Q_s)
+
+    assert batch.q_s == pytest.approx(conductor.q_s)
+
+    assert batch.q_c[0] == pytest.approx(conductor.q_c)
+
+    assert batch.q_r[0] == pytest.approx(conductor.q_r)
+
+    assert batch.I == pytest.approx([1025, 1200], abs=1.3)
+
+
+def test_conductor_batch_broadcasting():
+    dates = np.array([datetime(2023, 1, 1, 9), datetime(2023, 6, 10, 11), datetime(2023, 12, 31, 15)])
+    wind_speed = np.array([0.61, 2.0])[:, None]
+
+    batch = ConductorBatch(date=dates, wind_speed=wind_speed, clear_atmosphere=[True, False, True])
+
+    current = batch.conductor_current
+
+    assert current.shape == (2, 3)
+
+    for i, speed in enumerate(wind_speed[:, 0]):
+        for j, (date, clear) in enumerate(zip(dates, [True, False, True])):
+            conductor = Conductor()
+            conductor.use_default()
+            conductor.wind_speed = speed
+            conductor.date = date
+            conductor.clear_atmosphere = clear
+
+            assert current[i, j] == pytest.approx(conductor.conductor_current)
+
+
+def test_conductor_batch_unknown_input():
+    with pytest.raises(TypeError):
+        ConductorBatch(wind=1.0)
+
+
+def test_conductor_batch_from_states():
+    states = [ConductorState(wind_speed=speed, latitude=latitude) for speed, latitude in [(0.61, 30.0), (3.0, 45.0)]]
+
+    batch = ConductorBatch.from_states(states)
+
+    assert batch.I == pytest.approx([Conductor(state).I for state in states])
+
+
+def test_conductor_batch_update():
+    rng = np.random.default_rng(0)
+    batch = ConductorBatch(wind_speed=rng.uniform(0.5, 10.0, 100), latitude=rng.uniform(25.0, 50.0, 100))
+    batch.conductor_current
+    solar_heat_gain = batch.solar_heat_gain
+    radiated_heat_loss = batch.radiated_heat_loss
+
+    wind_speed = rng.uniform(0.5, 10.0, 100)
+    current = batch.update(wind_speed=wind_speed).conductor_current
+
+    assert batch.solar_heat_gain is solar_heat_gain
+    assert batch.radiated_heat_loss is radiated_heat_loss
+    assert current == pytest.approx(ConductorBatch(wind_speed=wind_speed, latitude=batch.latitude).conductor_current)
+
+    batch.update(ambient_temperature=20.0)
+
+    assert batch.solar_heat_gain is solar_heat_gain
+    assert batch.radiated_heat_loss is not radiated_heat_loss
+
+    with pytest.raises(TypeError):
+        batch.update(wind=1.0)
+
+
+def test_conductor_batch_float32():
+    conductor = Conductor()
+    conductor.use_default()
+
+    batch = ConductorBatch(dtype=np.float32, conductor_surface_temperature=[100.0, 119.6])
+
+    assert batch.conductor_current.dtype == np.float32
+    assert batch.conductor_current == pytest.approx([conductor.I, 1200], rel=Float32RelativeError, abs=1)
+
+    rng = np.random.default_rng(0)
+    ambient_temperature = rng.uniform(-30.0, 45.0, 10_000)
+    inputs = dict(
+        wind_speed=rng.uniform(1.0, 20.0, 10_000),
+        wind_direction=rng.uniform(0.0, 360.0, 10_000),
+        ambient_temperature=ambient_temperature,
+        # windy and hot enough above ambient for the losses to exceed the solar gain everywhere
+        conductor_surface_temperature=ambient_temperature + rng.uniform(30.0, 120.0, 10_000),
+        latitude=rng.uniform(-60.0, 60.0, 10_000),
+        azimuth_of_conductor=rng.uniform(0.0, 180.0, 10_000),
+    )
+    expected = ConductorBatch(**inputs).conductor_current
+
+    assert np.isfinite(expected).all()
+
+    for backend in backends.available_backends():
+        current = ConductorBatch(dtype=np.float32, **inputs).rate(backend)
+
+        assert current.dtype == np.float32
+        assert current == pytest.approx(expected, rel=Float32RelativeError)
+
+    batch = ConductorBatch(**inputs)
+    batch.conductor_current
+    batch.dtype = np.float32
+
+    assert batch.wind_speed.dtype == np.float32
+    assert batch.conductor_current.dtype == np.float32
+    assert batch.conductor_current == pytest.approx(expected, rel=Float32RelativeError)
+
+    with pytest.raises(TypeError):
+        ConductorBatch(dtype=np.int32)
@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from pyohm.models.conductor import Conductor
+from pyohm.models.conductor_batch import ConductorBatch
+from pyohm.models.solar import (
+    PolynomialCoefficientsOfClearAtmosphere,
+    PolynomialCoefficientsOfIndustrialAtmosphere,
+    SolarGeometryCache,
+    day_of_year,
+    hour_angle,
+    hour_of_day,
+    solar_altitude,
+    solar_azimuth,
+    solar_declination,
+    solar_heat_intensity,
+)
+
+
+def test_solar_geometry_cache_lookup():
+    cache = SolarGeometryCache(latitude_resolution=0.5)
+
+    latitude = np.array([30.0, 30.0, 45.5, 30.0])
+    number_of_day = np.array([161, 1, 200, 365])
+    hour = np.array([11, 9, 15, 0])
+
+    altitude, azimuth = cache.lookup(latitude, number_of_day, hour)
+
+    declination = solar_declination(number_of_day)
+    assert altitude == pytest.approx(solar_altitude(latitude, declination, hour_angle(hour)))
+    assert azimuth == pytest.approx(solar_azimuth(latitude, declination, hour_angle(hour)))
+
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (0, 4)
+
+    cache.lookup(30.2, 161, 11)
+
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_solar_geometry_cache_fractional_hour():
+    cache = SolarGeometryCache(latitude_resolution=1.0, hour_resolution=0.25)
+
+    hour = np.array([7.9, 11.37, 12.6, 16.05])
+    declination = solar_declination(161)
+    altitude, azimuth = cache.lookup(45.0, 161, hour)
+
+    assert altitude == pytest.approx(solar_altitude(45.0, declination, hour_angle(hour)), abs=0.05)
+    assert azimuth == pytest.approx(solar_azimuth(45.0, declination, hour_angle(hour)), abs=0.1)
+
+    for i in range(len(hour)):
+        assert cache.get(45.0, 161, hour[i]) == pytest.approx((altitude[i], azimuth[i]))
+
+
+def test_solar_geometry_cache_evicts_least_recently_used():
+    cache = SolarGeometryCache(latitude_resolution=1.0, max_rows=2)
+
+    cache.lookup([10.0, 20.0], 161, 11)
+    cache.get(10.0, 161, 11)
+    altitude, _ = cache.lookup(30.0, 161, 11)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert altitude == pytest.approx(solar_altitude(30.0, solar_declination(161), hour_angle(11)))
+
+    cache.get(10.0, 161, 11)
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    # a single lookup may need more rows than the bound
+    altitude, _ = cache.lookup([40.0, 50.0, 60.0], 161, 11)
+
+    assert len(cache) == 2
+    assert altitude == pytest.approx(
+        solar_altitude(np.array([40.0, 50.0, 60.0]), solar_declination(161), hour_angle(11))
+    )
+
+
+def test_solar_geometry_cache_keeps_rows_of_current_lookup():
+    cache = SolarGeometryCache(latitude_resolution=1.0, max_rows=2)
+
+    latitude = np.array([10.0, 20.0, 30.0])
+    cache.lookup(latitude[:2], 161, 11)
+    altitude, azimuth = cache.lookup(latitude, 161, 11)
+
+    declination = solar_declination(161)
+    assert altitude == pytest.approx(solar_altitude(latitude, declination, hour_angle(11)))
+    assert azimuth == pytest.approx(solar_azimuth(latitude, declination, hour_angle(11)))
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_solar_geometry_cache_interpolation():
+    cache = SolarGeometryCache(latitude_resolution=1.0, interpolate=True)
+
+    altitude, _ = cache.lookup(30.25, 161, 11)
+    declination = solar_declination(161)
+
+    assert altitude == pytest.approx(solar_altitude(30.25, declination, hour_angle(11)), abs=0.01)
+
+
+def test_conductor_uses_solar_geometry_cache():
+    expected = Conductor()
+    expected.use_default()
+
+    conductor = Conductor()
+    conductor.use_default()
+    conductor.solar_geometry = SolarGeometryCache()
+
+    assert conductor.H_c == pytest.approx(expected.H_c)
+    assert conductor.Z_c == pytest.approx(expected.Z_c)
+    assert conductor.I == pytest.approx(expected.I)
+
+    batch = ConductorBatch(latitude=[30.0, 30.0, 30.0])
+    batch.solar_geometry = conductor.solar_geometry
+
+    assert batch.I == pytest.approx(expected.I)
+    assert conductor.solar_geometry.misses == 1
+
+
+def test_solar_heat_intensity_mixed_atmosphere():
+    altitude = np.array([10.0, 45.0, 74.9, 90.0])
+    clear_atmosphere = np.array([True, False, True, False])
+
+    Qs = solar_heat_intensity(altitude, clear_atmosphere)
+
+    for H_c, clear, value in zip(altitude, clear_atmosphere, Qs):
+        table = PolynomialCoefficientsOfClearAtmosphere if clear else PolynomialCoefficientsOfIndustrialAtmosphere
+        expected = sum(coefficient * H_c**power for power, coefficient in enumerate(table.values()))
+
+        assert value == pytest.approx(expected)
+
+    assert solar_heat_intensity(altitude, True) == pytest.approx(solar_heat_intensity(altitude, [True] * 4))
+
+
+def test_sub_hourly_solar_time():
+    dates = np.datetime64("2023-06-10T00:00") + np.arange(0, 24 * 60, 5) * np.timedelta64(1, "m")
+
+    assert day_of_year(dates) == pytest.approx(161)
+    assert hour_of_day(dates) == pytest.approx(np.arange(0, 24 * 60, 5) / 60)
+    assert day_of_year(np.datetime64("2024-12-31T23:59:59")) == 366
+
+    batch = ConductorBatch(date=dates)
+
+    for i in (0, 100, 137, 287):
+        conductor = Conductor()
+        conductor.use_default()
+        conductor.date = dates[i].astype(object)
+
+        assert conductor.hour == pytest.approx(batch.hour[i])
+        assert batch.H_c[i] == pytest.approx(conductor.H_c)
+        assert batch.Z_c[i] == pytest.approx(conductor.Z_c)
+
+    cache = SolarGeometryCache(hour_resolution=5 / 60)
+    altitude, azimuth = cache.lookup(30.0, batch.number_of_day, batch.hour)
+
+    assert altitude == pytest.approx(batch.H_c)
@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+import pytest
+
+from pyohm.network.assets.loader import AssetValidationError, read_assets
+from pyohm.network.assets.model import AssetType, Model
+
+
+def test_read_assets_jsonl(tmp_path):
+    models = [
+        Model(id="n1", name="Bus 1", coordinates=(45.4, -75.7), asset_type=AssetType.Node),
+        Model(id="l1", name="Line 1", asset_type=AssetType.Line),
+    ]
+    path = tmp_path / "assets.jsonl"
+    path.write_text("\n".join(model.model_dump_json() for model in models) + "\n\n")
+
+    table = read_assets(path)
+
+    assert table.to_models() == models
+
+
+def test_read_assets_csv(tmp_path):
+    path = tmp_path / "assets.csv"
+    path.write_text("id,name,asset_type,x,y\nn1,Bus 1,Node,45.4,-75.7\ns1,Switch 1,Switch,,\n")
+
+    table = read_assets(path)
+
+    assert table.model(0) == Model(id="n1", name="Bus 1", coordinates=(45.4, -75.7), asset_type=AssetType.Node)
+    assert table.model(1) == Model(id="s1", name="Switch 1", asset_type=AssetType.Switch)
+    assert np.isnan(table.coordinates[1]).all()
+
+
+def test_read_assets_reports_all_bad_rows(tmp_path):
+    records = [
+        {"id": "n1", "name": "Bus 1", "asset_type": "Node", "coordinates": [45.4, -75.7]},
+        {"id": "n2", "name": "Bus 2", "asset_type": "Bus"},
+        {"id": "n3", "name": "Bus 3", "asset_type": "Node", "coordinates": [45.4, None]},
+        {"id": "n1", "name": "Bus 4", "asset_type": "Node", "coordinates": [1.0, 2.0, 3.0]},
+        {"name": "Bus 5", "asset_type": "Node"},
+    ]
+    path = tmp_path / "assets.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n{not json\n\n" + json.dumps(records[1]))
+
+    with pytest.raises(AssetValidationError) as error:
+        read_assets(path)
+
+    assert sorted(error.value.errors) == [1, 2, 3, 4, 5, 7]
+    assert error.value.errors[3] == ["coordinates must be a pair of finite numbers", "duplicate id"]
+    assert error.value.errors[4] == ["missing id"]
+    assert len(error.value.errors[5]) == 1 and error.value.errors[5][0].startswith("invalid JSON")
+    assert error.value.errors[7][-1] == "duplicate id"
+
+    path = tmp_path / "assets.csv"
+    path.write_text(
+        "id,name,asset_type,x,y\nn1,Bus 1,Node,inf,1\nn2,Bus 2,Node,a,1\nn3,Node\nn4,,Node,,\nn5,Bus 5,Node,,\n"
+    )
+
+    with pytest.raises(AssetValidationError) as error:
+        read_assets(path)
+
+    assert sorted(error.value.errors) == [0, 1, 2, 3]
+    assert error.value.errors[2] == ["wrong number of columns"]
+    assert error.value.errors[3] == ["missing name"]
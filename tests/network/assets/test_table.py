@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from pyohm.network.assets.model import AssetType, Model
+from pyohm.network.assets.table import AssetTable, AssetTypeCodes
+
+
+def test_asset_table_round_trip():
+    models = [
+        Model(id="n1", name="Bus 1", coordinates=(45.4, -75.7), asset_type=AssetType.Node),
+        Model(id="l1", name="Line 1", asset_type=AssetType.Line),
+        Model(id="n2", name="Bus 2", coordinates=(45.5, -75.6), asset_type="Node"),
+        Model(id="t1", name="Transformer 1", coordinates=(45.5, -75.6), asset_type=AssetType.Transformer),
+    ]
+
+    table = AssetTable.from_models(models)
+
+    assert len(table) == 4
+    assert table.coordinates.shape == (4, 2)
+    assert table.coordinates.flags.c_contiguous
+    assert np.isnan(table.coordinates[1]).all()
+    assert table.asset_types.tolist() == [AssetTypeCodes[model.asset_type] for model in models]
+    assert table.to_models() == models
+
+    assert "n2" in table
+    assert table.index("n2") == 2
+    assert table.indices(["t1", "n1"]).tolist() == [3, 0]
+    assert table.indices(np.array(["n2", "t1", "n2"])).tolist() == [2, 3, 2]
+    assert table.indices([]).tolist() == []
+    with pytest.raises(KeyError):
+        table.index("x")
+    with pytest.raises(KeyError):
+        table.indices(["n1", "x"])
+    with pytest.raises(KeyError):
+        table.indices(["zz"])
+
+    nodes = table.of_type(AssetType.Node)
+    assert nodes.tolist() == [0, 2]
+    assert table.of_type(AssetType.Line, AssetType.Transformer).tolist() == [1, 3]
+    assert table.take(nodes).to_models() == [models[0], models[2]]
+
+
+def test_asset_table_validation():
+    with pytest.raises(ValueError):
+        AssetTable(["a", "a"], ["A", "B"], [0, 0])
+
+    with pytest.raises(ValueError):
+        AssetTable(["a", "b"], ["A"], [0, 0])
+
+    with pytest.raises(ValueError):
+        AssetTable(["a"], ["A"], [len(AssetType)])
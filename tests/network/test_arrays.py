@@ -0,0 +1,11 @@
+import numpy as np
+
+from pyohm.network.arrays import ranges
+
+
+def test_ranges():
+    starts = np.array([3, 0, 5, 7])
+    stops = np.array([5, 0, 8, 8])
+
+    assert ranges(starts, stops).tolist() == [3, 4, 5, 6, 7, 7]
+    assert ranges(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)).tolist() == []
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from pyohm.network import spatial
+from pyohm.network.assets.model import AssetType, Model
+from pyohm.network.assets.table import AssetTable
+from pyohm.network.spatial import SpatialIndex
+
+
+def _brute_nearest(points, query, k):
+    distances = np.hypot(*(points - query).T)
+    order = np.argsort(distances, kind="stable")[:k]
+    return distances[order], order
+
+
+def test_spatial_index_queries():
+    rng = np.random.default_rng(0)
+    points = np.concatenate([rng.uniform(0.0, 100.0, (5000, 2)), rng.normal(50.0, 0.5, (5000, 2))])
+    index = SpatialIndex(points)
+
+    box = index.query_box([10.0, 20.0], [30.0, 25.0])
+    inside = np.flatnonzero((points[:, 0] >= 10) & (points[:, 0] <= 30) & (points[:, 1] >= 20) & (points[:, 1] <= 25))
+    assert sorted(box.tolist()) == inside.tolist()
+
+    queries = rng.uniform(-10.0, 110.0, (20, 2))
+    for query, ids in zip(queries, index.query_radius(queries, 3.0)):
+        assert sorted(ids.tolist()) == np.flatnonzero(np.hypot(*(points - query).T) <= 3.0).tolist()
+
+    distances, ids = index.query_nearest(np.vstack([queries, [[1e6, 1e6]]]), k=5)
+    assert distances.shape == ids.shape == (21, 5)
+    for query, query_distances, query_ids in zip(np.vstack([queries, [[1e6, 1e6]]]), distances, ids):
+        expected_distances, expected_ids = _brute_nearest(points, query, 5)
+        assert query_distances == pytest.approx(expected_distances)
+        assert query_ids.tolist() == expected_ids.tolist()
+
+
+def test_spatial_index_query_batches(monkeypatch):
+    rng = np.random.default_rng(1)
+    index = SpatialIndex(rng.uniform(0.0, 100.0, (2000, 2)))
+    index.insert(rng.uniform(0.0, 100.0, (10, 2)), np.arange(10) + 2000)
+    queries = rng.uniform(0.0, 100.0, (50, 2))
+    radius = index.query_radius(queries, 5.0)
+    nearest = index.query_nearest(queries, k=7)
+
+    monkeypatch.setattr(spatial, "QueryBatchSize", 8)
+
+    assert all(np.array_equal(a, b) for a, b in zip(index.query_radius(queries, 5.0), radius))
+    assert np.array_equal(index.query_nearest(queries, k=7)[1], nearest[1])
+    assert [np.array_equal(ids, index.query_radius(query, 5.0)[0]) for query, ids in zip(queries, radius)] == [
+        True
+    ] * 50
+
+
+def test_spatial_index_pending_candidates():
+    rng = np.random.default_rng(2)
+    points = rng.uniform(0.0, 100.0, (21000, 2))
+    index = SpatialIndex(points[:20000])
+    index.insert(points[20000:], np.arange(20000, 21000))
+    queries = rng.uniform(0.0, 100.0, (1000, 2))
+
+    # only the pending points in the cells of a box are its candidates, not the whole buffer
+    _, _, ids = index._candidates(queries - 1.0, queries + 1.0)
+    assert np.count_nonzero(ids >= 20000) < 10 * len(queries)
+
+    for query, found in zip(queries, index.query_radius(queries, 1.0)):
+        expected = np.flatnonzero(np.hypot(*(points - query).T) <= 1.0)
+        assert np.array_equal(np.sort(found), expected)
+
+
+def test_spatial_index_insert_delete():
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0.0, 10.0, (100, 2))
+    index = SpatialIndex(points)
+
+    index.insert([[20.0, 20.0], [5.0, 5.0]], [100, 101])
+    assert len(index) == 102
+    assert index.query_nearest([21.0, 21.0])[1].tolist() == [[100]]
+    assert 101 in index.query_box([4.9, 4.9], [5.1, 5.1])
+
+    assert index.delete([100, 3, 3, 999]) == 2
+    assert len(index) == 100
+    assert index.query_nearest([21.0, 21.0])[1].tolist() != [[100]]
+    assert 3 not in index.query_radius(points[3], 0.1)[0]
+
+    index.rebuild()
+    assert len(index) == 100
+    assert 101 in index.query_box([4.9, 4.9], [5.1, 5.1])
+
+    distances, ids = SpatialIndex(np.empty((0, 2))).query_nearest([0.0, 0.0], k=2)
+    assert ids.tolist() == [[-1, -1]]
+
+
+def test_spatial_index_from_table():
+    table = AssetTable.from_models(
+        [
+            Model(id="n1", name="Bus 1", coordinates=(0.0, 0.0), asset_type=AssetType.Node),
+            Model(id="l1", name="Line 1", asset_type=AssetType.Line),
+            Model(id="n2", name="Bus 2", coordinates=(1.0, 1.0), asset_type=AssetType.Node),
+        ]
+    )
+
+    index = SpatialIndex.from_table(table)
+
+    assert len(index) == 2
+    assert index.query_nearest([0.9, 0.9])[1].tolist() == [[2]]
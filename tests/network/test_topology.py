@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from pyohm.network.assets.model import AssetType, Model
+from pyohm.network.assets.table import AssetTable
+from pyohm.network.topology import Topology
+
+
+def test_topology():
+    # 0 - 1 - 2 - 0 triangle, 3 - 4 pair, 5 isolated
+    topology = Topology(6, [0, 1, 2, 3], [1, 2, 0, 4])
+
+    assert topology.neighbours(0).tolist() == [1, 2]
+    assert topology.branches[topology.indptr[4] : topology.indptr[5]].tolist() == [3]
+    assert topology.degrees.tolist() == [2, 2, 2, 1, 1, 0]
+
+    statistics = topology.degree_statistics()
+    assert (statistics.minimum, statistics.maximum) == (0, 2)
+    assert statistics.mean == pytest.approx(8 / 6)
+    assert statistics.counts.tolist() == [1, 2, 3]
+
+    count, labels = topology.connected_components()
+    assert count == 3
+    assert labels.tolist() == [0, 0, 0, 1, 1, 2]
+    assert topology.islands([0]).tolist() == [False, False, False, True, True, True]
+
+    order, depth, predecessor = topology.bfs(1)
+    assert order.tolist() == [1, 0, 2]
+    assert depth.tolist() == [1, 0, 1, -1, -1, -1]
+    assert predecessor.tolist() == [1, -1, 1, -1, -1, -1]
+
+    assert topology.dfs(0).tolist() == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        Topology(2, [0], [2])
+
+
+def test_topology_long_feeder():
+    nodes = 10_000
+    rng = np.random.default_rng(0)
+    permutation = rng.permutation(nodes)
+    topology = Topology(nodes, permutation[:-1], permutation[1:])
+
+    count, _ = topology.connected_components()
+    assert count == 1
+
+    order, depth, _ = topology.bfs(int(permutation[0]))
+    assert len(order) == nodes
+    assert depth[permutation].tolist() == list(range(nodes))
+    assert topology.dfs(int(permutation[0])).tolist() == permutation.tolist()
+
+
+def test_topology_from_assets():
+    table = AssetTable.from_models(
+        [
+            Model(id="n1", name="Bus 1", asset_type=AssetType.Node),
+            Model(id="l1", name="Line 1", asset_type=AssetType.Line),
+            Model(id="n2", name="Bus 2", asset_type=AssetType.Node),
+            Model(id="g1", name="Generator 1", asset_type=AssetType.Generator),
+            Model(id="s1", name="Switch 1", asset_type=AssetType.Switch),
+            Model(id="n3", name="Bus 3", asset_type=AssetType.Node),
+        ]
+    )
+
+    topology = Topology.from_assets(table, ["n1", "n2"], ["n2", "n3"])
+
+    assert topology.node_rows.tolist() == [0, 2, 5]
+    assert topology.branch_rows.tolist() == [1, 4]
+    assert topology.connected_components()[0] == 1
+
+    opened = Topology.from_assets(table, ["n1", "n2"], ["n2", "n3"], in_service=[True, False])
+
+    assert opened.branch_rows.tolist() == [1]
+    assert opened.islands([0]).tolist() == [False, False, True]
+
+    with pytest.raises(ValueError):
+        Topology.from_assets(table, ["n1", "g1"], ["n2", "n3"])
+    with pytest.raises(ValueError):
+        Topology.from_assets(table, ["n1", "n2"], ["n2", "n3"], in_service=[True])
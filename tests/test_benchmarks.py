@@ -0,0 +1,32 @@
+from benchmarks import spatial
+from benchmarks.conductor import compare, main, run_suite
+
+
+def test_run_suite():
+    results = run_suite([10], ["scalar/conductor_current", "batch/conductor_current"], repeat=1)
+
+    assert set(results) == {"scalar/conductor_current[10]", "batch/conductor_current[10]"}
+    assert all(result["ratings_per_second"] > 0 for result in results.values())
+
+
+def test_compare():
+    baseline = {"batch/conductor_current[10]": {"seconds": 1.0}}
+
+    assert compare({"batch/conductor_current[10]": {"seconds": 1.1}}, baseline) == []
+    assert len(compare({"batch/conductor_current[10]": {"seconds": 1.5}}, baseline)) == 1
+
+
+def test_main(tmp_path):
+    baseline = tmp_path / "baseline.json"
+
+    arguments = ["--sizes", "10", "--repeat", "1", "--only", "batch/t_film"]
+
+    assert main([*arguments, "--save", str(baseline)]) == 0
+    assert main([*arguments, "--compare", str(baseline), "--tolerance", "1000"]) == 0
+
+
+def test_spatial_run_suite():
+    results = spatial.run_suite([1000], queries=10)
+
+    assert set(results["1000"]) == {"build", "box", "radius", "nearest", "nearest_10", "linear_scan"}
+    assert spatial.main(["--sizes", "100", "--queries", "5"]) == 0